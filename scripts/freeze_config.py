@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""Freeze the current operator configuration into an importable module.
+
+Resolves OperatorConfig from the environment (and .env) once, then writes the
+values as literals to src/lazarus_operator/config_frozen.py. Set
+LAZARUS_FROZEN_CONFIG=1 at runtime to load that module instead of re-parsing
+the environment on every operator start.
+
+Usage:
+    python scripts/freeze_config.py [output_path]
+"""
+
+import sys
+from pathlib import Path
+
+import msgspec
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+
+from lazarus_operator.config import OperatorConfig  # noqa: E402
+
+DEFAULT_OUTPUT = ROOT / "src" / "lazarus_operator" / "config_frozen.py"
+
+
+def render(config: OperatorConfig) -> str:
+    """Render the configuration as Python source."""
+    lines = [
+        '"""Frozen operator configuration generated by scripts/freeze_config.py. Do not edit."""',
+        "",
+        "import msgspec",
+        "",
+        "from .config import OperatorConfig",
+        "",
+        "config = msgspec.convert(",
+        "    {",
+    ]
+    for field, value in msgspec.structs.asdict(config).items():
+        lines.append(f'        "{field}": {value!r},')
+    lines.extend(["    },", "    OperatorConfig,", ")"])
+    return "\n".join(lines) + "\n"
+
+
+def main() -> None:
+    """Write the frozen configuration module."""
+    output = Path(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_OUTPUT
+    output.write_text(render(OperatorConfig.from_env()))
+    print(f"Frozen configuration written to {output}")
+
+
+if __name__ == "__main__":
+    main()
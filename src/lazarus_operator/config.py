@@ -1,64 +1,141 @@
 """Configuration management for Lazarus operator."""
 
-from typing import Optional
+import importlib
+import os
+from functools import lru_cache
+from typing import Dict, Optional
 
-from pydantic import Field
-from pydantic_settings import BaseSettings, SettingsConfigDict
+import msgspec
 
+ENV_PREFIX = "LAZARUS_"
+ENV_FILE = ".env"
 
-class OperatorConfig(BaseSettings):
-    """Operator-level configuration."""
+# Boolean spellings accepted by pydantic-settings, which parsed this config before
+_BOOL_STRINGS = {
+    **dict.fromkeys(("1", "on", "t", "true", "y", "yes"), True),
+    **dict.fromkeys(("0", "off", "f", "false", "n", "no"), False),
+}
+
+
+def _parse_env_file(path: str) -> Dict[str, str]:
+    """Parse ``KEY=VALUE`` lines from a dotenv file.
+
+    Blank lines, comments and an optional ``export`` prefix are ignored, and a
+    single layer of matching quotes is stripped from values.
+
+    Args:
+        path: Path to the dotenv file
 
-    model_config = SettingsConfigDict(env_prefix="LAZARUS_", env_file=".env", extra="ignore")
+    Returns:
+        Dict of parsed values (empty if the file does not exist)
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            lines = f.read().splitlines()
+    except FileNotFoundError:
+        return {}
+
+    values: Dict[str, str] = {}
+    for line in lines:
+        key, sep, value = line.strip().partition("=")
+        if not sep or key.startswith("#"):
+            continue
+        key = key.removeprefix("export ").strip()
+        value = value.strip()
+        if len(value) >= 2 and value[0] == value[-1] and value[0] in "'\"":
+            value = value[1:-1]
+        values[key] = value
+    return values
+
+
+class OperatorConfig(msgspec.Struct, frozen=True, kw_only=True):
+    """Operator-level configuration."""
 
     # Operator settings
-    log_level: str = Field(default="INFO", description="Logging level")
-    namespace: str = Field(default="lazarus-system", description="Operator namespace")
-    test_namespace_prefix: str = Field(
-        default="lazarus-test", description="Prefix for test namespaces"
-    )
+    log_level: str = "INFO"
+    namespace: str = "lazarus-system"
+    test_namespace_prefix: str = "lazarus-test"  # Prefix for test namespaces
 
     # Velero settings
-    velero_namespace: str = Field(default="velero", description="Velero namespace")
-    velero_timeout: int = Field(default=600, description="Velero operation timeout in seconds")
+    velero_namespace: str = "velero"
+    velero_timeout: int = 600  # Velero operation timeout in seconds
 
     # Default test settings
-    default_ttl_hours: int = Field(default=24, description="Default TTL for test namespaces")
-    default_health_check_timeout: int = Field(
-        default=600, description="Default health check timeout in seconds"
-    )
-    default_health_check_retries: int = Field(
-        default=3, description="Default health check retry count"
-    )
+    default_ttl_hours: int = 24  # Default TTL for test namespaces
+    default_health_check_timeout: int = 600  # Seconds
+    default_health_check_retries: int = 3
+    health_check_coalesce_ttl: float = 2.0  # Seconds to reuse results of identical runs
 
     # Metrics settings
-    metrics_port: int = Field(default=8080, description="Prometheus metrics port")
-    enable_metrics: bool = Field(default=True, description="Enable Prometheus metrics")
+    metrics_port: int = 8080
+    enable_metrics: bool = True
 
     # Notification settings
-    slack_webhook_url: Optional[str] = Field(default=None, description="Slack webhook URL")
-    slack_channel: str = Field(default="#lazarus-alerts", description="Slack channel")
-    enable_slack_notifications: bool = Field(
-        default=False, description="Enable Slack notifications"
-    )
+    slack_webhook_url: Optional[str] = None
+    slack_channel: str = "#lazarus-alerts"
+    enable_slack_notifications: bool = False
+    slack_rate_limit_retries: int = 3  # Retries on Slack 429/5xx responses
+    slack_coalesce_window: float = 2.0  # Seconds to batch notifications into one post
 
     # Cleanup settings
-    enable_auto_cleanup: bool = Field(default=True, description="Enable automatic cleanup")
-    cleanup_on_success: bool = Field(
-        default=True, description="Delete test namespace on successful test"
-    )
-    cleanup_on_failure: bool = Field(
-        default=False, description="Delete test namespace on failed test (keep for debugging)"
-    )
+    enable_auto_cleanup: bool = True
+    cleanup_on_success: bool = True  # Delete test namespace on successful test
+    cleanup_on_failure: bool = False  # Keep failed test namespaces for debugging
 
     # Performance settings
-    max_concurrent_tests: int = Field(
-        default=5, description="Maximum concurrent restore tests"
-    )
-    reconcile_interval: int = Field(
-        default=60, description="Reconciliation interval in seconds"
-    )
+    max_concurrent_tests: int = 5
+    reconcile_interval: int = 60  # Reconciliation interval in seconds
+
+    @classmethod
+    def from_env(cls, env_file: Optional[str] = ENV_FILE) -> "OperatorConfig":
+        """Build configuration from ``LAZARUS_*`` environment variables.
+
+        Variable names are matched case-insensitively, and values from the
+        process environment take precedence over those in ``env_file``.
+        Boolean fields accept the same spellings as pydantic-settings, such as
+        ``yes``/``no`` and ``on``/``off``.
+
+        Args:
+            env_file: Optional dotenv file to read defaults from
+
+        Returns:
+            Validated configuration
+
+        Raises:
+            msgspec.ValidationError: If a value cannot be coerced to its field type
+        """
+        raw = _parse_env_file(env_file) if env_file else {}
+        raw.update(os.environ)
+        env = {key.upper(): value for key, value in raw.items()}
+
+        values: Dict[str, object] = {}
+        for field in msgspec.structs.fields(cls):
+            value = env.get(ENV_PREFIX + field.name.upper())
+            if value is None:
+                continue
+            if field.type is bool:
+                values[field.name] = _BOOL_STRINGS.get(value.strip().lower(), value)
+            else:
+                values[field.name] = value
+
+        return msgspec.convert(values, cls, strict=False)
+
+
+@lru_cache(maxsize=1)
+def get_config() -> OperatorConfig:
+    """Return the process-wide operator configuration, loading it on first use.
+
+    When ``LAZARUS_FROZEN_CONFIG`` is set, the values baked into ``config_frozen.py``
+    by ``scripts/freeze_config.py`` are used instead of parsing the environment.
+    """
+    if os.environ.get("LAZARUS_FROZEN_CONFIG", "").lower() in ("1", "true"):
+        # Imported by name: the generated module is not checked in
+        frozen = importlib.import_module(".config_frozen", __package__)
+        frozen_config: OperatorConfig = frozen.config
+        return frozen_config
+    return OperatorConfig.from_env()
 
 
-# Global config instance
-config = OperatorConfig()
+def reset_config() -> None:
+    """Drop the cached configuration so the next get_config() call reloads it."""
+    get_config.cache_clear()
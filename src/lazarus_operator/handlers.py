@@ -1,37 +1,99 @@
 """Main Kopf handlers for the Lazarus operator."""
 
 import asyncio
-from datetime import datetime
-from typing import Any, Dict
+import time
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional
 
 import kopf
+import msgspec
 from kubernetes import client
 from kubernetes.client.rest import ApiException
 
-from .config import config
+from .config import get_config
 from .logger import configure_logging, get_logger
 from .metrics import metrics, start_metrics_server
 from .notifications import notification_service
 from .smoke_test import SmokeTestRunner
 from .utils import (
-    calculate_elapsed_seconds,
     create_k8s_event,
     generate_test_namespace_name,
+    get_core_v1_api,
     parse_duration,
+    secret_cache,
 )
 from .velero_client import VeleroRestoreConfig, velero_client
 
-# Configure logging
-configure_logging()
 logger = get_logger(__name__)
 
-# Start metrics server
-start_metrics_server()
+
+def _now_iso() -> str:
+    """Return the current UTC time as an ISO 8601 string with a Z suffix."""
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+class RestoreProgress(msgspec.Struct, rename="camel"):
+    """Item counts reported by the Velero restore."""
+
+    items_restored: int
+    items_attempted: int
+
+
+class RestoreInfo(msgspec.Struct, omit_defaults=True, rename="camel"):
+    """Status of the Velero restore step."""
+
+    phase: str
+    restore_name: Optional[str] = None
+    progress: Optional[RestoreProgress] = None
+    errors: Optional[int] = None
+
+
+class HealthCheckStatus(msgspec.Struct):
+    """Outcome of a single health check."""
+
+    name: str
+    status: str
+    message: str
+    duration: float
+
+
+class HealthChecksInfo(msgspec.Struct, omit_defaults=True):
+    """Status of the health check step."""
+
+    phase: str
+    results: Optional[List[HealthCheckStatus]] = None
+
+
+class RestoreTestResult(msgspec.Struct, omit_defaults=True, rename="camel"):
+    """Final result of a restore test."""
+
+    success: Optional[bool] = None
+    rto: Optional[int] = None
+    rpo: Optional[int] = None
+    message: Optional[str] = None
+    resources_recovered: Optional[int] = None
+    resources_failed: Optional[int] = None
+
+
+class RestoreTestStatus(msgspec.Struct, omit_defaults=True, rename="camel"):
+    """Status reported for a LaziusRestoreTest resource."""
+
+    phase: str
+    start_time: str
+    restore: RestoreInfo
+    health_checks: HealthChecksInfo
+    result: RestoreTestResult
+    completion_time: Optional[str] = None
 
 
 @kopf.on.startup()
 async def on_startup(settings: kopf.OperatorSettings, **kwargs: Any) -> None:
     """Configure operator startup settings."""
+    configure_logging()
+    start_metrics_server()
+    velero_client.start_informers()
+
+    config = get_config()
     settings.persistence.finalizer = "lazarus.io/finalizer"
     settings.posting.level = "info"
     settings.watching.server_timeout = 600
@@ -47,6 +109,9 @@ async def on_startup(settings: kopf.OperatorSettings, **kwargs: Any) -> None:
 async def on_cleanup(**kwargs: Any) -> None:
     """Cleanup on operator shutdown."""
     logger.info("Lazarus operator shutting down")
+    await SmokeTestRunner.aclose()
+    await notification_service.aclose()
+    await velero_client.aclose()
 
 
 @kopf.on.create("lazarus.io", "v1alpha1", "lazarusrestoretests")
@@ -71,43 +136,69 @@ async def handle_restore_test_create(
     Returns:
         Status update dict
     """
-    logger.info("Processing LaziusRestoreTest", name=name, namespace=namespace)
+    config = get_config()
+    operator_namespace = config.namespace
+    test_namespace_prefix = config.test_namespace_prefix
+    velero_timeout = config.velero_timeout
+    cleanup_on_success = config.cleanup_on_success
+    cleanup_on_failure = config.cleanup_on_failure
+    default_ttl_hours = config.default_ttl_hours
 
     backup_name = spec.get("backupName")
     restore_namespace = spec.get("restoreNamespace")
 
+    log = logger.bind(name=name, namespace=namespace, backup_name=backup_name)
+    log.info("Processing LaziusRestoreTest")
+
     if not backup_name:
         raise kopf.PermanentError("backupName is required")
 
     if not restore_namespace:
         # Generate namespace name if not provided
         restore_namespace = generate_test_namespace_name(
-            backup_name, config.test_namespace_prefix
+            backup_name, test_namespace_prefix
         )
-        logger.info("Generated restore namespace", namespace=restore_namespace)
+        log.info("Generated restore namespace", restore_namespace=restore_namespace)
 
     # Initialize status
-    start_time = datetime.utcnow().isoformat() + "Z"
-    status = {
-        "phase": "Running",
-        "startTime": start_time,
-        "restore": {"phase": "Pending"},
-        "healthChecks": {"phase": "Pending"},
-        "result": {},
-    }
+    start_mono = time.monotonic()
+    start_time = _now_iso()
+    status = RestoreTestStatus(
+        phase="Running",
+        start_time=start_time,
+        restore=RestoreInfo(phase="Pending"),
+        health_checks=HealthChecksInfo(phase="Pending"),
+        result=RestoreTestResult(),
+    )
 
     metrics.record_test_start(backup_name)
 
     try:
-        # Step 1: Verify backup exists
-        logger.info("Verifying backup exists", backup_name=backup_name)
-        backup = await velero_client.get_backup(backup_name)
+        # Steps 1-2: Verify backup exists while creating the test namespace
+        log.info(
+            "Verifying backup and creating test namespace", restore_namespace=restore_namespace
+        )
+        backup, namespace_created = await asyncio.gather(
+            velero_client.get_backup(backup_name),
+            create_test_namespace(restore_namespace, backup_name),
+            return_exceptions=True,
+        )
+        if isinstance(namespace_created, BaseException):
+            raise namespace_created
 
-        if not backup:
-            raise kopf.PermanentError(f"Backup {backup_name} not found")
+        # Discard the new namespace if the backup lookup failed or it is unusable,
+        # otherwise every retry leaves another timestamped namespace behind
+        if isinstance(backup, BaseException):
+            if namespace_created:
+                await _discard_namespace(restore_namespace)
+            raise backup
 
-        backup_phase = backup.get("status", {}).get("phase")
+        backup_phase = backup.get("status", {}).get("phase") if backup else None
         if backup_phase != "Completed":
+            if namespace_created:
+                await _discard_namespace(restore_namespace)
+            if not backup:
+                raise kopf.PermanentError(f"Backup {backup_name} not found")
             raise kopf.PermanentError(
                 f"Backup {backup_name} is not completed (phase: {backup_phase})"
             )
@@ -119,20 +210,18 @@ async def handle_restore_test_create(
             message=f"Backup {backup_name} verified and ready for restore",
         )
 
-        # Step 2: Create test namespace
-        logger.info("Creating test namespace", namespace=restore_namespace)
-        await create_test_namespace(restore_namespace, backup_name)
-
         # Step 3: Create Velero restore
-        logger.info("Creating Velero restore", backup_name=backup_name)
-        restore_name = f"restore-test-{backup_name}-{datetime.utcnow().strftime('%Y%m%d%H%M%S')}"
+        log.info("Creating Velero restore")
+        restore_name = (
+            "restore-test-" + backup_name + "-" + time.strftime("%Y%m%d%H%M%S", time.gmtime())
+        )
 
         restore_config = VeleroRestoreConfig(
             backup_name=backup_name,
             target_namespace=restore_namespace,
             included_namespaces=spec.get("restore", {}).get("includedNamespaces", ["*"]),
             excluded_namespaces=spec.get("restore", {}).get(
-                "excludedNamespaces", ["kube-system", "velero", config.namespace]
+                "excludedNamespaces", ["kube-system", "velero", operator_namespace]
             ),
             included_resources=spec.get("restore", {}).get("includedResources", []),
             excluded_resources=spec.get("restore", {}).get("excludedResources", []),
@@ -140,11 +229,11 @@ async def handle_restore_test_create(
             restore_status=spec.get("restore", {}).get("restoreStatus", False),
         )
 
-        restore_start = datetime.utcnow()
+        restore_start = time.monotonic()
         restore = await velero_client.create_restore(restore_name, restore_config)
 
-        status["restore"]["restoreName"] = restore_name
-        status["restore"]["phase"] = "InProgress"
+        status.restore.restore_name = restore_name
+        status.restore.phase = "InProgress"
 
         create_k8s_event(
             name=name,
@@ -154,24 +243,29 @@ async def handle_restore_test_create(
         )
 
         # Step 4: Wait for restore to complete
-        logger.info("Waiting for restore to complete", restore_name=restore_name)
+        log.info("Waiting for restore to complete", restore_name=restore_name)
         restore = await velero_client.wait_for_restore(
-            restore_name, timeout=config.velero_timeout
+            restore_name, timeout=velero_timeout
         )
 
-        restore_duration = (datetime.utcnow() - restore_start).total_seconds()
+        restore_duration = time.monotonic() - restore_start
         metrics.record_restore_duration(backup_name, restore_duration)
 
         # Parse restore stats
         restore_stats = velero_client.parse_restore_stats(restore)
-        logger.info("Restore completed", restore_name=restore_name, stats=restore_stats)
+        log.info(
+            "Restore completed",
+            restore_name=restore_name,
+            duration=restore_duration,
+            stats=restore_stats,
+        )
 
-        status["restore"]["phase"] = "Completed"
-        status["restore"]["progress"] = {
-            "itemsRestored": restore_stats["items_restored"],
-            "itemsAttempted": restore_stats["items_attempted"],
-        }
-        status["restore"]["errors"] = restore_stats.get("errors", 0)
+        status.restore.phase = "Completed"
+        status.restore.progress = RestoreProgress(
+            items_restored=restore_stats["items_restored"],
+            items_attempted=restore_stats["items_attempted"],
+        )
+        status.restore.errors = restore_stats.get("errors", 0)
 
         metrics.record_resources_restored(backup_name, restore_stats["items_restored"])
 
@@ -186,60 +280,64 @@ async def handle_restore_test_create(
         health_check_config = spec.get("healthChecks", {})
 
         if health_check_config.get("enabled", True):
-            logger.info("Running health checks", test_name=name)
-            status["healthChecks"]["phase"] = "Running"
+            log.info("Running health checks")
+            status.health_checks.phase = "Running"
 
-            # Allow time for resources to stabilize
-            await asyncio.sleep(5)
+            # Allow time for restored pods to be scheduled
+            await wait_for_pods_scheduled(restore_namespace)
 
             runner = SmokeTestRunner(health_check_config)
             test_results = await runner.run_all_checks()
 
-            status["healthChecks"]["phase"] = "Completed"
-            status["healthChecks"]["results"] = [
-                {
-                    "name": check.name,
-                    "status": check.status.value,
-                    "message": check.message,
-                    "duration": check.duration,
-                }
-                for check in test_results.checks
-            ]
-
-            # Record metrics
+            # Build status entries and record metrics in a single pass
+            results = []
             for check in test_results.checks:
+                check_name = check.name
+                check_status = check.status.value
+                duration = check.duration
+                results.append(
+                    HealthCheckStatus(
+                        name=check_name,
+                        status=check_status,
+                        message=check.message,
+                        duration=duration,
+                    )
+                )
                 metrics.record_health_check(
                     check_type="custom",
-                    check_name=check.name,
-                    success=(check.status.value == "Passed"),
-                    duration=check.duration,
+                    check_name=check_name,
+                    success=(check_status == "Passed"),
+                    duration=duration,
                 )
 
+            status.health_checks.phase = "Completed"
+            status.health_checks.results = results
+
             overall_success = test_results.overall_success
         else:
-            logger.info("Health checks disabled", test_name=name)
-            status["healthChecks"]["phase"] = "Skipped"
+            log.info("Health checks disabled")
+            status.health_checks.phase = "Skipped"
             overall_success = True
 
         # Step 6: Calculate RTO/RPO
-        completion_time = datetime.utcnow().isoformat() + "Z"
-        rto = calculate_elapsed_seconds(start_time, completion_time)
+        rto = time.monotonic() - start_mono
+        completion_time = _now_iso()
         rpo = 0  # TODO: Calculate based on backup timestamp vs latest data
 
-        status["completionTime"] = completion_time
-        status["result"] = {
-            "success": overall_success,
-            "rto": int(rto),
-            "rpo": rpo,
-            "message": "Restore test completed successfully"
+        status.completion_time = completion_time
+        status.result = RestoreTestResult(
+            success=overall_success,
+            rto=int(rto),
+            rpo=rpo,
+            message="Restore test completed successfully"
             if overall_success
             else "Restore test failed health checks",
-            "resourcesRecovered": restore_stats["items_restored"],
-            "resourcesFailed": restore_stats.get("errors", 0),
-        }
+            resources_recovered=restore_stats["items_restored"],
+            resources_failed=restore_stats.get("errors", 0),
+        )
 
         if overall_success:
-            status["phase"] = "Succeeded"
+            status.phase = "Succeeded"
             create_k8s_event(
                 name=name,
                 namespace=namespace,
@@ -247,7 +345,7 @@ async def handle_restore_test_create(
                 message=f"Backup restore test passed (RTO: {int(rto)}s)",
             )
         else:
-            status["phase"] = "Failed"
+            status.phase = "Failed"
             create_k8s_event(
                 name=name,
                 namespace=namespace,
@@ -266,8 +364,10 @@ async def handle_restore_test_create(
         )
 
         # Step 7: Send notifications
-        notification_config = spec.get("notifications", {})
-        if overall_success and notification_config.get("onSuccess", {}).get("slack", {}).get("enabled"):
+        notification_config = spec.get("notifications") or {}
+        on_success_slack = (notification_config.get("onSuccess") or {}).get("slack") or {}
+        on_failure_slack = (notification_config.get("onFailure") or {}).get("slack") or {}
+        if overall_success and on_success_slack.get("enabled"):
             await notification_service.notify_test_success(
                 test_name=name,
                 backup_name=backup_name,
@@ -278,33 +378,31 @@ async def handle_restore_test_create(
                     "timestamp": completion_time,
                 },
             )
-        elif not overall_success and notification_config.get("onFailure", {}).get("slack", {}).get("enabled"):
+        elif not overall_success and on_failure_slack.get("enabled"):
             await notification_service.notify_test_failure(
                 test_name=name,
                 backup_name=backup_name,
-                error=status["result"]["message"],
+                error=status.result.message,
                 metadata={
                     "timestamp": completion_time,
-                    "mention_on_failure": notification_config.get("onFailure", {})
-                    .get("slack", {})
-                    .get("mentionOnFailure"),
+                    "mention_on_failure": on_failure_slack.get("mentionOnFailure"),
                 },
             )
 
         # Step 8: Schedule cleanup
-        cleanup_config = spec.get("cleanup", {})
+        cleanup_config = spec.get("cleanup") or {}
         if cleanup_config.get("enabled", True):
-            should_cleanup = (
-                overall_success and config.cleanup_on_success
-            ) or (not overall_success and config.cleanup_on_failure)
+            should_cleanup = (overall_success and cleanup_on_success) or (
+                not overall_success and cleanup_on_failure
+            )
 
             if should_cleanup:
-                ttl = spec.get("ttl", f"{config.default_ttl_hours}h")
+                ttl = spec.get("ttl", f"{default_ttl_hours}h")
                 ttl_seconds = int(parse_duration(ttl).total_seconds())
 
-                logger.info(
+                log.info(
                     "Scheduling cleanup",
-                    namespace=restore_namespace,
+                    restore_namespace=restore_namespace,
                     ttl_seconds=ttl_seconds,
                 )
 
@@ -313,24 +411,21 @@ async def handle_restore_test_create(
                     cleanup_test_namespace(restore_namespace, ttl_seconds, restore_name)
                 )
 
-        return status
+        return msgspec.to_builtins(status)
 
     except kopf.PermanentError:
         raise
     except Exception as e:
-        logger.error("Restore test failed", name=name, error=str(e), exc_info=True)
+        log.error("Restore test failed", error=str(e), exc_info=True)
 
-        status["phase"] = "Failed"
-        status["completionTime"] = datetime.utcnow().isoformat() + "Z"
-        status["result"] = {
-            "success": False,
-            "message": f"Test failed: {str(e)}",
-        }
+        status.phase = "Failed"
+        status.completion_time = _now_iso()
+        status.result = RestoreTestResult(success=False, message=f"Test failed: {str(e)}")
 
         metrics.record_test_complete(
             backup_name=backup_name,
             success=False,
-            duration=calculate_elapsed_seconds(start_time),
+            duration=time.monotonic() - start_mono,
             rto=0,
             rpo=0,
         )
@@ -376,14 +471,17 @@ async def handle_restore_test_delete(
     logger.info("Cleaned up test resources", test_name=name)
 
 
-async def create_test_namespace(namespace: str, backup_name: str) -> None:
+async def create_test_namespace(namespace: str, backup_name: str) -> bool:
     """Create a test namespace for restore.
 
     Args:
         namespace: Namespace to create
         backup_name: Backup name (for labeling)
+
+    Returns:
+        True if the namespace was created, False if it already existed
     """
-    v1 = client.CoreV1Api()
+    v1 = get_core_v1_api()
 
     namespace_body = client.V1Namespace(
         metadata=client.V1ObjectMeta(
@@ -397,15 +495,14 @@ async def create_test_namespace(namespace: str, backup_name: str) -> None:
     )
 
     try:
-        await asyncio.get_event_loop().run_in_executor(
-            None, v1.create_namespace, namespace_body
-        )
+        await asyncio.to_thread(v1.create_namespace, namespace_body)
         logger.info("Created test namespace", namespace=namespace)
+        return True
     except ApiException as e:
         if e.status == 409:  # Already exists
             logger.info("Test namespace already exists", namespace=namespace)
-        else:
-            raise
+            return False
+        raise
 
 
 async def delete_namespace(namespace: str) -> None:
@@ -414,12 +511,11 @@ async def delete_namespace(namespace: str) -> None:
     Args:
         namespace: Namespace to delete
     """
-    v1 = client.CoreV1Api()
+    v1 = get_core_v1_api()
 
     try:
-        await asyncio.get_event_loop().run_in_executor(
-            None, v1.delete_namespace, namespace
-        )
+        await asyncio.to_thread(v1.delete_namespace, namespace)
+        secret_cache.stop(namespace)
         logger.info("Deleted namespace", namespace=namespace)
         metrics.record_cleanup(success=True)
     except ApiException as e:
@@ -429,6 +525,50 @@ async def delete_namespace(namespace: str) -> None:
             raise
 
 
+def _pod_scheduled(pod: Any) -> bool:
+    """Check whether a pod reports the PodScheduled condition."""
+    conditions = (pod.status and pod.status.conditions) or []
+    return any(c.type == "PodScheduled" and c.status == "True" for c in conditions)
+
+
+async def wait_for_pods_scheduled(
+    namespace: str, timeout: float = 5.0, poll_interval: float = 0.25
+) -> None:
+    """Wait for restored pods in a namespace to be scheduled.
+
+    Returns as soon as the namespace has pods and all of them are scheduled,
+    or once the timeout elapses.
+
+    Args:
+        namespace: Namespace to watch
+        timeout: Maximum time to wait in seconds
+        poll_interval: Polling interval in seconds
+    """
+    v1 = get_core_v1_api()
+    deadline = time.monotonic() + timeout
+
+    while time.monotonic() < deadline:
+        try:
+            pods = await asyncio.to_thread(v1.list_namespaced_pod, namespace)
+        except ApiException as e:
+            logger.warning("Failed to list restored pods", namespace=namespace, error=str(e))
+            return
+
+        if pods.items and all(_pod_scheduled(pod) for pod in pods.items):
+            logger.debug("Restored pods scheduled", namespace=namespace, count=len(pods.items))
+            return
+
+        await asyncio.sleep(poll_interval)
+
+
+async def _discard_namespace(namespace: str) -> None:
+    """Delete a namespace created for a test that cannot proceed, logging failures."""
+    try:
+        await delete_namespace(namespace)
+    except Exception as e:
+        logger.warning("Failed to discard test namespace", namespace=namespace, error=str(e))
+
+
 async def cleanup_test_namespace(
     namespace: str, delay_seconds: int, restore_name: str
 ) -> None:
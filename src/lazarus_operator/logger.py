@@ -4,10 +4,11 @@ import logging
 import sys
 from typing import Any
 
+import orjson
 import structlog
 from structlog.typing import EventDict
 
-from .config import config
+from .config import get_config
 
 
 def add_app_context(logger: Any, method_name: str, event_dict: EventDict) -> EventDict:
@@ -17,35 +18,69 @@ def add_app_context(logger: Any, method_name: str, event_dict: EventDict) -> Eve
     return event_dict
 
 
+def _orjson_dumps(obj: Any, **kwargs: Any) -> str:
+    """Serialize a log event with orjson, falling back to ``default`` for unknown types."""
+    return orjson.dumps(
+        obj, default=kwargs.get("default", str), option=orjson.OPT_NON_STR_KEYS
+    ).decode()
+
+
+class _EventFormatter(logging.Formatter):
+    """Emit the rendered event only; tracebacks are already embedded by format_exc_info."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        return record.getMessage()
+
+
 def configure_logging() -> None:
-    """Configure structured logging for the operator."""
+    """Configure structured logging for the operator.
+
+    Level filtering is done by the stdlib loggers, so disabled levels are
+    dropped before any structlog processor runs.
+    """
+    config = get_config()
+    level = getattr(logging, config.log_level.upper())
+
     # Configure stdlib logging
-    logging.basicConfig(
-        format="%(message)s",
-        stream=sys.stdout,
-        level=getattr(logging, config.log_level.upper()),
-    )
+    logging.basicConfig(format="%(message)s", stream=sys.stdout, level=level)
+
+    # Operator loggers get their own handler so events are emitted as bare JSON
+    # even when kopf has already configured the root logger
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(_EventFormatter())
+    operator_logger = logging.getLogger(__package__)
+    operator_logger.handlers = [handler]
+    operator_logger.setLevel(level)
+    operator_logger.propagate = False
 
     # Configure structlog
     structlog.configure(
         processors=[
+            structlog.stdlib.filter_by_level,
             structlog.contextvars.merge_contextvars,
             structlog.processors.add_log_level,
-            structlog.processors.TimeStamper(fmt="iso"),
+            structlog.processors.TimeStamper(fmt="iso", utc=True),
             add_app_context,
-            structlog.processors.StackInfoRenderer(),
             structlog.processors.format_exc_info,
-            structlog.processors.JSONRenderer(),
+            structlog.processors.JSONRenderer(serializer=_orjson_dumps),
         ],
-        wrapper_class=structlog.make_filtering_bound_logger(
-            getattr(logging, config.log_level.upper())
-        ),
+        wrapper_class=structlog.stdlib.BoundLogger,
         context_class=dict,
-        logger_factory=structlog.PrintLoggerFactory(),
+        logger_factory=structlog.stdlib.LoggerFactory(),
         cache_logger_on_first_use=True,
     )
 
 
-def get_logger(name: str) -> structlog.BoundLogger:
+def get_logger(name: str) -> structlog.stdlib.BoundLogger:
     """Get a logger instance with the given name."""
-    return structlog.get_logger(name)
+    logger: structlog.stdlib.BoundLogger = structlog.get_logger(name)
+    return logger
+
+
+def is_debug_enabled(name: str) -> bool:
+    """Return whether DEBUG events from the named logger would be emitted.
+
+    Lets hot paths skip building event kwargs for debug calls that the
+    stdlib level filter would drop anyway.
+    """
+    return logging.getLogger(name).isEnabledFor(logging.DEBUG)
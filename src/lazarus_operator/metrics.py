@@ -1,8 +1,20 @@
 """Prometheus metrics for Lazarus operator."""
 
-from prometheus_client import Counter, Gauge, Histogram, Info, start_http_server
-
-from .config import config
+from typing import Any, Dict, Optional, Tuple
+
+from prometheus_client import (
+    GC_COLLECTOR,
+    PLATFORM_COLLECTOR,
+    PROCESS_COLLECTOR,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    Info,
+    start_http_server,
+)
+
+from .config import get_config
 from .logger import get_logger
 
 logger = get_logger(__name__)
@@ -11,12 +23,26 @@ logger = get_logger(__name__)
 class MetricsCollector:
     """Centralized metrics collection for the operator."""
 
-    def __init__(self) -> None:
-        """Initialize metrics collectors."""
+    def __init__(self, registry: Optional[CollectorRegistry] = None) -> None:
+        """Initialize metrics collectors.
+
+        Args:
+            registry: Registry to register metrics in. Defaults to a new registry
+                that also exposes the standard process, platform and GC collectors.
+        """
+        config = get_config()
+
+        if registry is None:
+            registry = CollectorRegistry()
+            for collector in (PROCESS_COLLECTOR, PLATFORM_COLLECTOR, GC_COLLECTOR):
+                registry.register(collector)
+        self.registry = registry
+
         # Info metric
         self.operator_info = Info(
             "lazarus_operator",
             "Information about the Lazarus operator",
+            registry=registry,
         )
         self.operator_info.info(
             {
@@ -30,33 +56,36 @@ class MetricsCollector:
             "lazarus_restore_tests_total",
             "Total number of restore tests executed",
             ["backup_name", "result"],
+            registry=registry,
         )
 
         self.test_duration = Histogram(
             "lazarus_restore_test_duration_seconds",
             "Duration of restore tests in seconds",
-            ["backup_name", "phase"],
+            ["phase"],
             buckets=[10, 30, 60, 120, 300, 600, 900, 1800, 3600],
+            registry=registry,
         )
 
         # Restore metrics
         self.restore_duration = Histogram(
             "lazarus_velero_restore_duration_seconds",
             "Duration of Velero restore operation in seconds",
-            ["backup_name"],
             buckets=[10, 30, 60, 120, 300, 600, 900, 1800],
+            registry=registry,
         )
 
         self.resources_restored = Gauge(
             "lazarus_resources_restored_total",
-            "Number of resources restored from backup",
-            ["backup_name"],
+            "Number of resources restored by the most recent restore",
+            registry=registry,
         )
 
         self.restore_errors = Counter(
             "lazarus_restore_errors_total",
             "Total number of restore errors",
             ["backup_name", "error_type"],
+            registry=registry,
         )
 
         # Health check metrics
@@ -64,6 +93,7 @@ class MetricsCollector:
             "lazarus_health_checks_total",
             "Total number of health checks executed",
             ["check_type", "check_name", "result"],
+            registry=registry,
         )
 
         self.health_check_duration = Histogram(
@@ -71,26 +101,29 @@ class MetricsCollector:
             "Duration of health checks in seconds",
             ["check_type", "check_name"],
             buckets=[0.1, 0.5, 1, 2, 5, 10, 30, 60],
+            registry=registry,
         )
 
         # RTO/RPO metrics
         self.rto_seconds = Histogram(
             "lazarus_recovery_time_objective_seconds",
             "Measured Recovery Time Objective in seconds",
-            ["backup_name"],
             buckets=[60, 300, 600, 1800, 3600, 7200],
+            registry=registry,
         )
 
         self.rpo_seconds = Gauge(
             "lazarus_recovery_point_objective_seconds",
             "Measured Recovery Point Objective in seconds",
             ["backup_name"],
+            registry=registry,
         )
 
         # Active tests gauge
         self.active_tests = Gauge(
             "lazarus_active_tests",
             "Number of currently running restore tests",
+            registry=registry,
         )
 
         # Cleanup metrics
@@ -98,10 +131,27 @@ class MetricsCollector:
             "lazarus_cleanup_operations_total",
             "Total number of cleanup operations",
             ["result"],
+            registry=registry,
         )
 
+        # Label children resolved so far, keyed by (metric, *label_values)
+        self._children: Dict[Tuple[Any, ...], Any] = {}
+
+        # Children with label values known up front
+        self._test_duration_total = self.test_duration.labels(phase="total")
+        self._cleanup_success = self.cleanup_total.labels(result="success")
+        self._cleanup_failure = self.cleanup_total.labels(result="failure")
+
         logger.info("Metrics collector initialized")
 
+    def _child(self, metric: Any, *label_values: str) -> Any:
+        """Return the labelled child of a metric, caching it after the first lookup."""
+        key = (metric, *label_values)
+        child = self._children.get(key)
+        if child is None:
+            child = self._children[key] = metric.labels(*label_values)
+        return child
+
     def record_test_start(self, backup_name: str) -> None:
         """Record test start."""
         self.active_tests.inc()
@@ -112,10 +162,10 @@ class MetricsCollector:
     ) -> None:
         """Record test completion."""
         result = "success" if success else "failure"
-        self.tests_total.labels(backup_name=backup_name, result=result).inc()
-        self.test_duration.labels(backup_name=backup_name, phase="total").observe(duration)
-        self.rto_seconds.labels(backup_name=backup_name).observe(rto)
-        self.rpo_seconds.labels(backup_name=backup_name).set(rpo)
+        self._child(self.tests_total, backup_name, result).inc()
+        self._test_duration_total.observe(duration)
+        self.rto_seconds.observe(rto)
+        self._child(self.rpo_seconds, backup_name).set(rpo)
         self.active_tests.dec()
         logger.info(
             "Test completed",
@@ -128,40 +178,47 @@ class MetricsCollector:
 
     def record_restore_duration(self, backup_name: str, duration: float) -> None:
         """Record Velero restore duration."""
-        self.restore_duration.labels(backup_name=backup_name).observe(duration)
+        self.restore_duration.observe(duration)
+        logger.debug("Restore duration recorded", backup_name=backup_name, duration=duration)
 
     def record_resources_restored(self, backup_name: str, count: int) -> None:
         """Record number of resources restored."""
-        self.resources_restored.labels(backup_name=backup_name).set(count)
+        self.resources_restored.set(count)
+        logger.debug("Resources restored recorded", backup_name=backup_name, count=count)
 
     def record_restore_error(self, backup_name: str, error_type: str) -> None:
         """Record restore error."""
-        self.restore_errors.labels(backup_name=backup_name, error_type=error_type).inc()
+        self._child(self.restore_errors, backup_name, error_type).inc()
 
     def record_health_check(
         self, check_type: str, check_name: str, success: bool, duration: float
     ) -> None:
         """Record health check result."""
         result = "pass" if success else "fail"
-        self.health_checks_total.labels(
-            check_type=check_type, check_name=check_name, result=result
-        ).inc()
-        self.health_check_duration.labels(check_type=check_type, check_name=check_name).observe(
-            duration
-        )
+        self._child(self.health_checks_total, check_type, check_name, result).inc()
+        self._child(self.health_check_duration, check_type, check_name).observe(duration)
 
     def record_cleanup(self, success: bool) -> None:
         """Record cleanup operation."""
-        result = "success" if success else "failure"
-        self.cleanup_total.labels(result=result).inc()
+        (self._cleanup_success if success else self._cleanup_failure).inc()
 
 
 # Global metrics instance
 metrics = MetricsCollector()
 
 
+_server_started = False
+
+
 def start_metrics_server() -> None:
-    """Start Prometheus metrics HTTP server."""
-    if config.enable_metrics:
-        start_http_server(config.metrics_port)
+    """Start Prometheus metrics HTTP server.
+
+    Safe to call more than once; the listener is only bound on the first call.
+    """
+    global _server_started
+
+    config = get_config()
+    if config.enable_metrics and not _server_started:
+        start_http_server(config.metrics_port, registry=metrics.registry)
+        _server_started = True
         logger.info("Metrics server started", port=config.metrics_port)
@@ -1,29 +1,215 @@
 """Notification system for test results."""
 
 import asyncio
-from typing import Any, Dict, Optional
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, List, Optional, Tuple
 
 import httpx
-from slack_sdk.webhook.async_client import AsyncWebhookClient
+import orjson
 
-from .config import config
+from .config import get_config
 from .logger import get_logger
 
 logger = get_logger(__name__)
 
+# Base delay for exponential backoff on Slack 5xx responses, in seconds
+SLACK_RETRY_BASE_DELAY = 0.2
+
+# Upper bound on a Retry-After wait, so one 429 cannot stall the queue
+SLACK_MAX_RETRY_AFTER = 30.0
+
+# Slack rejects messages with more than 50 blocks
+SLACK_MAX_BLOCKS = 50
+
+# Queued notification: fallback text and its blocks
+Notification = Tuple[str, List[Dict[str, Any]]]
+
+# Static Block Kit blocks, shared by every message. They are never mutated.
+_SUCCESS_HEADER_BLOCK: Dict[str, Any] = {
+    "type": "header",
+    "text": {"type": "plain_text", "text": "Backup Restore Test Passed", "emoji": False},
+}
+_FAILURE_HEADER_BLOCK: Dict[str, Any] = {
+    "type": "header",
+    "text": {"type": "plain_text", "text": "Backup Restore Test Failed", "emoji": False},
+}
+_DIVIDER_BLOCK: Dict[str, Any] = {"type": "divider"}
+
+
+def _mrkdwn(text: str) -> Dict[str, str]:
+    """Build a mrkdwn text object."""
+    return {"type": "mrkdwn", "text": text}
+
+
+def _retry_after_delay(value: Optional[str], fallback: float) -> float:
+    """Return the wait in seconds requested by a ``Retry-After`` header.
+
+    The header may hold either delay seconds or an HTTP-date. Missing or
+    unparseable values use ``fallback``. The result is capped at
+    ``SLACK_MAX_RETRY_AFTER``.
+
+    Args:
+        value: Raw header value, if present
+        fallback: Delay to use when the header cannot be parsed
+
+    Returns:
+        Delay in seconds
+    """
+    delay = fallback
+    if value is not None:
+        try:
+            delay = float(value)
+        except ValueError:
+            try:
+                retry_at = parsedate_to_datetime(value)
+            except (TypeError, ValueError):
+                pass
+            else:
+                if retry_at.tzinfo is None:
+                    retry_at = retry_at.replace(tzinfo=timezone.utc)
+                delay = (retry_at - datetime.now(timezone.utc)).total_seconds()
+    return min(max(delay, 0.0), SLACK_MAX_RETRY_AFTER)
+
 
 class NotificationService:
     """Service for sending notifications about test results."""
 
     def __init__(self):
         """Initialize notification service."""
+        config = get_config()
         self.slack_webhook_url = config.slack_webhook_url
-        self.slack_client: Optional[AsyncWebhookClient] = None
+        self.slack_client: Optional[httpx.AsyncClient] = None
+        self.max_retries = config.slack_rate_limit_retries
+        self.coalesce_window = config.slack_coalesce_window
+        self._queue: Optional["asyncio.Queue[Optional[Notification]]"] = None
+        self._flusher: Optional["asyncio.Task[None]"] = None
 
         if self.slack_webhook_url and config.enable_slack_notifications:
-            self.slack_client = AsyncWebhookClient(url=self.slack_webhook_url)
+            self.slack_client = httpx.AsyncClient(timeout=httpx.Timeout(30))
             logger.info("Slack notifications enabled")
 
+    async def _enqueue(self, text: str, blocks: List[Dict[str, Any]]) -> None:
+        """Queue a message for the next coalesced post, starting the flusher if needed."""
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+        if self._flusher is None or self._flusher.done():
+            self._flusher = asyncio.create_task(self._run_flusher(self._queue))
+        await self._queue.put((text, blocks))
+
+    async def _run_flusher(self, queue: "asyncio.Queue[Optional[Notification]]") -> None:
+        """Collect queued messages for one coalescing window at a time and post them.
+
+        A ``None`` item flushes whatever is pending and stops the flusher.
+        """
+        while True:
+            items = [await queue.get()]
+            if items[0] is not None:
+                await asyncio.sleep(self.coalesce_window)
+            while not queue.empty():
+                items.append(queue.get_nowait())
+
+            pending = [item for item in items if item is not None]
+            if pending:
+                await self._flush(pending)
+            if len(pending) < len(items):
+                return
+
+    async def _flush(self, items: List[Notification]) -> None:
+        """Post queued messages as few Slack messages as the block limit allows.
+
+        Args:
+            items: Queued messages in arrival order
+        """
+        # Group messages so each post, including dividers, stays within the block limit
+        batches: List[List[Notification]] = []
+        size = 0
+        for item in items:
+            if batches and size + 1 + len(item[1]) <= SLACK_MAX_BLOCKS:
+                batches[-1].append(item)
+                size += 1 + len(item[1])
+            else:
+                batches.append([item])
+                size = len(item[1])
+
+        for batch in batches:
+            blocks: List[Dict[str, Any]] = []
+            for _, item_blocks in batch:
+                if blocks:
+                    blocks.append(_DIVIDER_BLOCK)
+                blocks.extend(item_blocks)
+            text = batch[0][0] if len(batch) == 1 else f"{len(batch)} backup restore test results"
+
+            try:
+                response = await self._send_with_retry(text=text, blocks=blocks)
+            except Exception as e:
+                logger.error("Failed to send Slack notification", error=str(e))
+                continue
+            if response.status_code != 200:
+                logger.error(
+                    "Slack notification rejected",
+                    status_code=response.status_code,
+                    body=response.text,
+                    messages=len(batch),
+                )
+                continue
+            logger.info("Slack notification sent", messages=len(batch))
+
+    async def aclose(self) -> None:
+        """Flush pending notifications and close the HTTP client; call on operator shutdown."""
+        if self._queue is not None and self._flusher is not None and not self._flusher.done():
+            await self._queue.put(None)
+            await self._flusher
+        if self.slack_client is not None:
+            await self.slack_client.aclose()
+
+    async def _send_with_retry(self, text: str, blocks: List[Dict[str, Any]]) -> httpx.Response:
+        """Send a Slack message, retrying when rate limited or on server errors.
+
+        A 429 response waits for the ``Retry-After`` interval, capped at
+        ``SLACK_MAX_RETRY_AFTER``; 5xx responses, and 429s whose header cannot be
+        parsed, back off exponentially from ``SLACK_RETRY_BASE_DELAY``.
+
+        Args:
+            text: Fallback text of the message
+            blocks: Slack Block Kit blocks
+
+        Returns:
+            The last webhook response received
+
+        Raises:
+            RuntimeError: If Slack notifications are not configured
+        """
+        if self.slack_client is None or not self.slack_webhook_url:
+            raise RuntimeError("Slack notifications are not configured")
+        payload = orjson.dumps({"text": text, "blocks": blocks})
+        attempt = 0
+        while True:
+            response = await self.slack_client.post(
+                self.slack_webhook_url,
+                content=payload,
+                headers={"Content-Type": "application/json"},
+            )
+            backoff = SLACK_RETRY_BASE_DELAY * (2**attempt)
+            if response.status_code == 429:
+                delay = _retry_after_delay(response.headers.get("Retry-After", "1"), backoff)
+            elif response.status_code >= 500:
+                delay = backoff
+            else:
+                return response
+
+            if attempt >= self.max_retries:
+                return response
+
+            attempt += 1
+            logger.warning(
+                "Slack notification deferred",
+                status_code=response.status_code,
+                retry_in=delay,
+                attempt=attempt,
+            )
+            await asyncio.sleep(delay)
+
     async def notify_test_success(
         self, test_name: str, backup_name: str, metadata: Dict[str, Any]
     ) -> None:
@@ -43,47 +229,28 @@ class NotificationService:
             rto = metadata.get("rto", "N/A")
             rpo = metadata.get("rpo", "N/A")
             resources = metadata.get("resources_restored", 0)
+            timestamp = metadata.get("timestamp", "unknown")
 
-            message = {
-                "blocks": [
-                    {
-                        "type": "header",
-                        "text": {
-                            "type": "plain_text",
-                            "text": "Backup Restore Test Passed",
-                            "emoji": False,
-                        },
-                    },
-                    {
-                        "type": "section",
-                        "fields": [
-                            {"type": "mrkdwn", "text": f"*Backup:*\n{backup_name}"},
-                            {"type": "mrkdwn", "text": f"*Test:*\n{test_name}"},
-                            {"type": "mrkdwn", "text": f"*RTO:*\n{rto}s"},
-                            {"type": "mrkdwn", "text": f"*RPO:*\n{rpo}s"},
-                            {
-                                "type": "mrkdwn",
-                                "text": f"*Resources Restored:*\n{resources}",
-                            },
-                        ],
-                    },
-                    {
-                        "type": "context",
-                        "elements": [
-                            {
-                                "type": "mrkdwn",
-                                "text": f"Backup recovery validated successfully at {metadata.get('timestamp', 'unknown')}",
-                            }
-                        ],
-                    },
-                ],
-            }
-
-            await self.slack_client.send(
-                text=f"Backup restore test passed: {backup_name}",
-                blocks=message["blocks"],
-            )
-            logger.info("Slack notification sent (success)", test_name=test_name)
+            blocks = [
+                _SUCCESS_HEADER_BLOCK,
+                {
+                    "type": "section",
+                    "fields": [
+                        _mrkdwn(f"*Backup:*\n{backup_name}"),
+                        _mrkdwn(f"*Test:*\n{test_name}"),
+                        _mrkdwn(f"*RTO:*\n{rto}s"),
+                        _mrkdwn(f"*RPO:*\n{rpo}s"),
+                        _mrkdwn(f"*Resources Restored:*\n{resources}"),
+                    ],
+                },
+                {
+                    "type": "context",
+                    "elements": [_mrkdwn(f"Backup recovery validated successfully at {timestamp}")],
+                },
+            ]
+
+            await self._enqueue(text=f"Backup restore test passed: {backup_name}", blocks=blocks)
+            logger.debug("Slack notification queued (success)", test_name=test_name)
         except Exception as e:
             logger.error("Failed to send Slack notification", error=str(e))
 
@@ -104,58 +271,37 @@ class NotificationService:
             return
 
         try:
-            message = {
-                "blocks": [
-                    {
-                        "type": "header",
-                        "text": {
-                            "type": "plain_text",
-                            "text": "Backup Restore Test Failed",
-                            "emoji": False,
-                        },
-                    },
-                    {
-                        "type": "section",
-                        "fields": [
-                            {"type": "mrkdwn", "text": f"*Backup:*\n{backup_name}"},
-                            {"type": "mrkdwn", "text": f"*Test:*\n{test_name}"},
-                        ],
-                    },
-                    {
-                        "type": "section",
-                        "text": {
-                            "type": "mrkdwn",
-                            "text": f"*Error:*\n```{error[:500]}```",
-                        },
-                    },
-                    {
-                        "type": "context",
-                        "elements": [
-                            {
-                                "type": "mrkdwn",
-                                "text": f"Backup recovery validation failed at {metadata.get('timestamp', 'unknown')}. Investigate immediately!",
-                            }
-                        ],
-                    },
-                ],
-            }
+            timestamp = metadata.get("timestamp", "unknown")
+
+            blocks = [_FAILURE_HEADER_BLOCK]
 
             # Add mention if configured
             mention = metadata.get("mention_on_failure")
             if mention:
-                message["blocks"].insert(
-                    1,
-                    {
-                        "type": "section",
-                        "text": {"type": "mrkdwn", "text": f"cc: {mention}"},
-                    },
-                )
+                blocks.append({"type": "section", "text": _mrkdwn(f"cc: {mention}")})
 
-            await self.slack_client.send(
-                text=f"Backup restore test failed: {backup_name}",
-                blocks=message["blocks"],
-            )
-            logger.info("Slack notification sent (failure)", test_name=test_name)
+            blocks += [
+                {
+                    "type": "section",
+                    "fields": [
+                        _mrkdwn(f"*Backup:*\n{backup_name}"),
+                        _mrkdwn(f"*Test:*\n{test_name}"),
+                    ],
+                },
+                {"type": "section", "text": _mrkdwn(f"*Error:*\n```{error[:500]}```")},
+                {
+                    "type": "context",
+                    "elements": [
+                        _mrkdwn(
+                            f"Backup recovery validation failed at {timestamp}. "
+                            "Investigate immediately!"
+                        )
+                    ],
+                },
+            ]
+
+            await self._enqueue(text=f"Backup restore test failed: {backup_name}", blocks=blocks)
+            logger.debug("Slack notification queued (failure)", test_name=test_name)
         except Exception as e:
             logger.error("Failed to send Slack notification", error=str(e))
 
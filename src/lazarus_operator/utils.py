@@ -1,11 +1,25 @@
 """Utility functions for the Lazarus operator."""
 
+import base64
 import hashlib
 import re
-from datetime import datetime, timedelta
-from typing import Any, Dict, Optional
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Any, Dict, Optional, Set, Tuple
 
-from kubernetes import client
+from kubernetes import client, watch
+
+from .config import get_config
+from .logger import get_logger
+
+logger = get_logger(__name__)
+
+# Characters not allowed in DNS-1123 labels (after lowercasing)
+_INVALID_NAME_CHARS = re.compile(r"[^a-z0-9-]")
+_DURATION_RE = re.compile(r"(\d+)([dhms])")
+_DURATION_UNITS = {"d": "days", "h": "hours", "m": "minutes", "s": "seconds"}
 
 
 def generate_test_namespace_name(backup_name: str, prefix: str = "lazarus-test") -> str:
@@ -18,16 +32,16 @@ def generate_test_namespace_name(backup_name: str, prefix: str = "lazarus-test")
     Returns:
         Valid Kubernetes namespace name
     """
-    timestamp = datetime.utcnow().strftime("%Y%m%d%H%M%S")
+    timestamp = time.strftime("%Y%m%d%H%M%S", time.gmtime())
     # Sanitize backup name to be DNS-compatible
-    safe_backup_name = re.sub(r"[^a-z0-9-]", "-", backup_name.lower())
+    safe_backup_name = _INVALID_NAME_CHARS.sub("-", backup_name.lower())
     safe_backup_name = safe_backup_name[:30]  # Limit length
 
     namespace = f"{prefix}-{safe_backup_name}-{timestamp}"
     # Ensure it's within Kubernetes limits (63 chars)
     if len(namespace) > 63:
         # Use hash to shorten
-        hash_suffix = hashlib.md5(backup_name.encode()).hexdigest()[:8]
+        hash_suffix = hashlib.blake2b(backup_name.encode(), digest_size=4).hexdigest()
         namespace = f"{prefix}-{hash_suffix}-{timestamp}"
 
     return namespace
@@ -44,23 +58,226 @@ def parse_duration(duration_str: str) -> timedelta:
     Returns:
         timedelta object
     """
-    pattern = r"(\d+)([dhms])"
-    match = re.match(pattern, duration_str.lower())
+    match = _DURATION_RE.match(duration_str.lower())
 
     if not match:
         raise ValueError(f"Invalid duration format: {duration_str}")
 
     value, unit = match.groups()
-    value = int(value)
+    return timedelta(**{_DURATION_UNITS[unit]: int(value)})
+
+
+@lru_cache(maxsize=1)
+def get_api_client() -> client.ApiClient:
+    """Return the ApiClient shared by every Kubernetes API wrapper, creating it on first use.
+
+    Building it lazily means the kube config loaded at operator login is picked
+    up. urllib3 keeps at most connection_pool_maxsize idle keep-alive
+    connections and closes any extra ones when they are released, so the pool
+    is sized for every connection that can be in use at once: a request and a
+    secret watch per concurrent test, plus the two Velero informer watches.
+    Short requests then reuse warm connections instead of paying a new TLS
+    handshake.
+    """
+    configuration = client.Configuration.get_default_copy()
+    configuration.connection_pool_maxsize = max(
+        configuration.connection_pool_maxsize, 2 * get_config().max_concurrent_tests + 2
+    )
+    return client.ApiClient(configuration)
+
+
+@lru_cache(maxsize=1)
+def get_core_v1_api() -> client.CoreV1Api:
+    """Return the shared CoreV1Api client, creating it on first use."""
+    return client.CoreV1Api(get_api_client())
+
 
-    units = {
-        "d": timedelta(days=value),
-        "h": timedelta(hours=value),
-        "m": timedelta(minutes=value),
-        "s": timedelta(seconds=value),
-    }
+@lru_cache(maxsize=1)
+def get_custom_objects_api() -> client.CustomObjectsApi:
+    """Return the shared CustomObjectsApi client, creating it on first use."""
+    return client.CustomObjectsApi(get_api_client())
 
-    return units[unit]
+
+class _SecretCache:
+    """Watch-backed cache of looked-up Secret data, keyed by (namespace, name).
+
+    The first lookup in a namespace starts a background watch from the
+    namespace's current resource version. Only Secrets that have been looked
+    up are cached; the watch keeps them in sync, so repeated lookups do not hit
+    the API server. Values are base64-decoded once per key and cached until the
+    Secret changes. A watch that has served no lookups for IDLE_TIMEOUT_SECONDS
+    stops and forgets its namespace.
+    """
+
+    # Server-side watch timeout; bounds how long stop() and idle expiry take to take effect
+    WATCH_TIMEOUT_SECONDS = 60
+    # Stop watching a namespace after this long without lookups
+    IDLE_TIMEOUT_SECONDS = 600
+
+    def __init__(self) -> None:
+        # (namespace, name) -> (raw base64 data, decoded values by key)
+        self._secrets: Dict[Tuple[str, str], Tuple[Dict[str, str], Dict[str, str]]] = {}
+        # Secrets that have been looked up and are kept in sync by the watch
+        self._requested: Set[Tuple[str, str]] = set()
+        self._last_used: Dict[str, float] = {}
+        self._watches: Dict[str, watch.Watch] = {}
+        self._lock = threading.Lock()
+
+    def get(self, namespace: str, name: str, key: str) -> Optional[str]:
+        """Return the decoded value of a Secret key.
+
+        Args:
+            namespace: Namespace of the secret
+            name: Name of the secret
+            key: Key within the secret
+
+        Returns:
+            Decoded value or None if the key is not present
+
+        Raises:
+            ApiException: If the secret is not cached and cannot be read
+        """
+        self._ensure_watch(namespace)
+
+        entry = self._secrets.get((namespace, name))
+        if entry is None:
+            # Register first so watch events arriving during the read are kept
+            with self._lock:
+                self._requested.add((namespace, name))
+            secret = get_core_v1_api().read_namespaced_secret(name=name, namespace=namespace)
+            entry = self._store(namespace, secret, replace=False)
+
+        data, decoded = entry
+        if key not in decoded:
+            if key not in data:
+                return None
+            decoded[key] = base64.b64decode(data[key]).decode("utf-8")
+        return decoded[key]
+
+    def stop(self, namespace: str) -> None:
+        """Stop watching a namespace and drop its cached secrets."""
+        with self._lock:
+            w = self._watches.pop(namespace, None)
+            self._drop_namespace(namespace)
+        if w is not None:
+            w.stop()
+
+    def _store(
+        self, namespace: str, secret: Any, replace: bool = True
+    ) -> Tuple[Dict[str, str], Dict[str, str]]:
+        """Cache a Secret's raw data, discarding previously decoded values.
+
+        Args:
+            namespace: Namespace of the secret
+            secret: V1Secret to cache
+            replace: Whether to overwrite an existing entry; direct reads pass
+                False so a newer version already delivered by the watch wins
+        """
+        entry: Tuple[Dict[str, str], Dict[str, str]] = (secret.data or {}, {})
+        cache_key = (namespace, secret.metadata.name)
+        with self._lock:
+            if replace:
+                self._secrets[cache_key] = entry
+            else:
+                entry = self._secrets.setdefault(cache_key, entry)
+        return entry
+
+    def _drop_values(self, namespace: str) -> None:
+        """Forget the cached values of a namespace; the caller holds the lock."""
+        for key in [k for k in self._secrets if k[0] == namespace]:
+            del self._secrets[key]
+
+    def _drop_namespace(self, namespace: str) -> None:
+        """Forget everything about a namespace; the caller holds the lock."""
+        self._drop_values(namespace)
+        self._requested = {k for k in self._requested if k[0] != namespace}
+        self._last_used.pop(namespace, None)
+
+    def _ensure_watch(self, namespace: str) -> None:
+        """Record a lookup and start watching the namespace if not already watching.
+
+        Raises:
+            ApiException: If the starting resource version cannot be read
+        """
+        with self._lock:
+            self._last_used[namespace] = time.monotonic()
+            if namespace in self._watches:
+                return
+
+        # Taken before the caller reads, so no later change can be missed
+        resource_version = self._current_resource_version(namespace)
+        with self._lock:
+            if namespace in self._watches:
+                return
+            w = watch.Watch()
+            self._watches[namespace] = w
+
+        threading.Thread(
+            target=self._run_watch,
+            args=(namespace, w, resource_version),
+            name=f"secret-watch-{namespace}",
+            daemon=True,
+        ).start()
+
+    @staticmethod
+    def _current_resource_version(namespace: str) -> str:
+        """Return the current resource version of a namespace's Secrets, listing at most one."""
+        listing = get_core_v1_api().list_namespaced_secret(namespace, limit=1)
+        return listing.metadata.resource_version  # type: ignore[no-any-return]
+
+    def _idle(self, namespace: str) -> bool:
+        """Whether a namespace has served no lookups for IDLE_TIMEOUT_SECONDS."""
+        last_used = self._last_used.get(namespace, 0.0)
+        return time.monotonic() - last_used > self.IDLE_TIMEOUT_SECONDS
+
+    def _run_watch(self, namespace: str, w: watch.Watch, resource_version: str) -> None:
+        """Apply watch events to the cache until stopped, idle, or the watch fails."""
+        v1 = get_core_v1_api()
+        # Deserialise with the shared ApiClient instead of a fresh one per watch
+        w._api_client = v1.api_client
+        try:
+            while self._watches.get(namespace) is w:
+                if self._idle(namespace):
+                    logger.debug("Stopping idle secret watch", namespace=namespace)
+                    with self._lock:
+                        if self._watches.get(namespace) is w:
+                            del self._watches[namespace]
+                            self._drop_namespace(namespace)
+                    break
+
+                try:
+                    for event in w.stream(
+                        v1.list_namespaced_secret,
+                        namespace=namespace,
+                        resource_version=resource_version,
+                        timeout_seconds=self.WATCH_TIMEOUT_SECONDS,
+                    ):
+                        secret = event["object"]
+                        resource_version = secret.metadata.resource_version
+                        cache_key = (namespace, secret.metadata.name)
+                        if event["type"] == "DELETED":
+                            with self._lock:
+                                self._secrets.pop(cache_key, None)
+                        elif cache_key in self._requested:
+                            self._store(namespace, secret)
+                except client.exceptions.ApiException as e:
+                    if e.status != 410:
+                        raise
+                    # Watch history expired: updates may have been missed, so drop
+                    # the cached values and resume from the current version
+                    with self._lock:
+                        self._drop_values(namespace)
+                    resource_version = self._current_resource_version(namespace)
+        except Exception as e:
+            # Fall back to direct reads; the next lookup restarts the watch
+            logger.warning("Secret watch stopped", namespace=namespace, error=str(e))
+            with self._lock:
+                if self._watches.get(namespace) is w:
+                    del self._watches[namespace]
+                    self._drop_namespace(namespace)
+
+
+secret_cache = _SecretCache()
 
 
 def get_resource_from_secret(
@@ -68,6 +285,8 @@ def get_resource_from_secret(
 ) -> Optional[str]:
     """Retrieve a value from a Kubernetes secret.
 
+    Lookups are served from a watch-backed cache once the namespace is warm.
+
     Args:
         secret_name: Name of the secret
         secret_key: Key within the secret
@@ -77,12 +296,7 @@ def get_resource_from_secret(
         Decoded secret value or None if not found
     """
     try:
-        v1 = client.CoreV1Api()
-        secret = v1.read_namespaced_secret(name=secret_name, namespace=namespace)
-        if secret.data and secret_key in secret.data:
-            import base64
-
-            return base64.b64decode(secret.data[secret_key]).decode("utf-8")
+        return secret_cache.get(namespace, secret_name, secret_key)
     except client.exceptions.ApiException:
         pass
     return None
@@ -107,12 +321,12 @@ def create_k8s_event(
         involved_object: Object the event relates to
     """
     try:
-        v1 = client.CoreV1Api()
-        timestamp = datetime.utcnow().isoformat() + "Z"
+        v1 = get_core_v1_api()
+        timestamp = datetime.now(timezone.utc).isoformat(timespec="seconds")
 
         event = client.V1Event(
             metadata=client.V1ObjectMeta(
-                name=f"{name}.{datetime.utcnow().strftime('%s')}",
+                name=f"{name}.{int(time.time())}",
                 namespace=namespace,
             ),
             type=event_type,
@@ -147,7 +361,7 @@ def sanitize_resource_name(name: str, max_length: int = 63) -> str:
         Sanitized name
     """
     # Convert to lowercase and replace invalid chars
-    sanitized = re.sub(r"[^a-z0-9-]", "-", name.lower())
+    sanitized = _INVALID_NAME_CHARS.sub("-", name.lower())
     # Remove leading/trailing hyphens
     sanitized = sanitized.strip("-")
     # Ensure within length limit
@@ -159,6 +373,8 @@ def sanitize_resource_name(name: str, max_length: int = 63) -> str:
 def calculate_elapsed_seconds(start_time: str, end_time: Optional[str] = None) -> float:
     """Calculate elapsed time in seconds between two ISO timestamps.
 
+    Timestamps without a UTC offset are assumed to be UTC.
+
     Args:
         start_time: ISO format start timestamp
         end_time: ISO format end timestamp (defaults to now)
@@ -166,10 +382,15 @@ def calculate_elapsed_seconds(start_time: str, end_time: Optional[str] = None) -
     Returns:
         Elapsed seconds
     """
-    start = datetime.fromisoformat(start_time.replace("Z", "+00:00"))
-    if end_time:
-        end = datetime.fromisoformat(end_time.replace("Z", "+00:00"))
-    else:
-        end = datetime.utcnow()
+    start = _parse_utc(start_time)
+    end = _parse_utc(end_time) if end_time else datetime.now(timezone.utc)
 
     return (end - start).total_seconds()
+
+
+def _parse_utc(timestamp: str) -> datetime:
+    """Parse an ISO timestamp, treating values without an offset as UTC."""
+    parsed = datetime.fromisoformat(timestamp)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
@@ -1,46 +1,264 @@
 """Velero client for interacting with Velero backups and restores."""
 
 import asyncio
-from datetime import datetime
-from typing import Any, Dict, List, Optional
-
-from kubernetes import client
+import random
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional
+
+import orjson
+from kubernetes import client, watch
 from kubernetes.client.rest import ApiException
 
-from .config import config
+from .config import get_config
 from .logger import get_logger
+from .utils import get_custom_objects_api
 
 logger = get_logger(__name__)
 
+# Restore phases after which Velero no longer updates the restore
+TERMINAL_RESTORE_PHASES = ("Completed", "Failed", "PartiallyFailed")
+# Label set on every restore the operator creates
+RESTORE_TEST_LABEL = "lazarus.io/test"
+
+
+def _loads(response: Any) -> Dict[str, Any]:
+    """Decode a raw API response (requested with _preload_content=False) with orjson."""
+    return orjson.loads(response.data)  # type: ignore[no-any-return]
+
+
+def _backoff_delay(attempt: int, base: float = 1.0, cap: float = 30.0) -> float:
+    """Return an exponential backoff delay with jitter for the given retry attempt.
+
+    The +/-50% jitter keeps callers that failed together from retrying in lockstep.
 
+    Args:
+        attempt: Zero-based count of consecutive failures
+        base: Delay for the first retry in seconds
+        cap: Upper bound for the un-jittered delay in seconds
+
+    Returns:
+        Delay in seconds
+    """
+    return min(cap, base * 2**attempt) * random.uniform(0.5, 1.5)
+
+
+@dataclass(slots=True)
 class VeleroRestoreConfig:
-    """Configuration for a Velero restore operation."""
+    """Configuration for a Velero restore operation.
+
+    Included namespaces default to ``["*"]`` and the other filters to empty
+    lists. ``namespace_mapping`` is derived from the included namespaces.
+    """
+
+    backup_name: str
+    target_namespace: str
+    included_namespaces: List[str] = field(default_factory=lambda: ["*"])
+    excluded_namespaces: List[str] = field(default_factory=list)
+    included_resources: List[str] = field(default_factory=list)
+    excluded_resources: List[str] = field(default_factory=list)
+    restore_pvs: bool = True
+    restore_status: bool = False
+    namespace_mapping: Dict[str, str] = field(init=False)
+
+    def __post_init__(self) -> None:
+        # Explicitly named namespaces are restored into the target namespace;
+        # the "*" wildcard cannot be mapped and is left out
+        self.namespace_mapping = {
+            ns: self.target_namespace for ns in self.included_namespaces if ns != "*"
+        }
+
+
+class VeleroInformer:
+    """In-process cache of one Velero resource type, kept current by list+watch.
+
+    A background thread lists the resources once, then applies watch events
+    to a dict keyed by name, so reads do not need an API round trip. When the
+    watch history expires (410 Gone) the cache is rebuilt from a fresh list.
+    """
+
+    # Server-side watch timeout; the watch is resumed from the last resource version
+    WATCH_TIMEOUT_SECONDS = 300
+    # Bounds of the jittered exponential delay before relisting after a watch failure
+    RETRY_BASE_SECONDS = 1.0
+    RETRY_MAX_SECONDS = 30.0
 
     def __init__(
         self,
-        backup_name: str,
-        target_namespace: str,
-        included_namespaces: Optional[List[str]] = None,
-        excluded_namespaces: Optional[List[str]] = None,
-        included_resources: Optional[List[str]] = None,
-        excluded_resources: Optional[List[str]] = None,
-        restore_pvs: bool = True,
-        restore_status: bool = False,
+        get_api: Callable[[], client.CustomObjectsApi],
+        group: str,
+        version: str,
+        namespace: str,
+        plural: str,
+        label_selector: Optional[str] = None,
     ):
-        """Initialize restore configuration."""
-        self.backup_name = backup_name
-        self.target_namespace = target_namespace
-        self.included_namespaces = included_namespaces or ["*"]
-        self.excluded_namespaces = excluded_namespaces or []
-        self.included_resources = included_resources or []
-        self.excluded_resources = excluded_resources or []
-        self.restore_pvs = restore_pvs
-        self.restore_status = restore_status
+        """Initialize the informer.
+
+        Args:
+            get_api: Returns the API client used for list and watch calls
+            group: API group of the resource
+            version: API version of the resource
+            namespace: Namespace to watch
+            plural: Plural resource name, e.g. "restores"
+            label_selector: Optional selector limiting which resources are cached
+        """
+        self._get_api = get_api
+        self.group = group
+        self.version = version
+        self.namespace = namespace
+        self.plural = plural
+        self.label_selector = label_selector
+        self._items: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._listeners: List[Callable[[str, Dict[str, Any]], None]] = []
+        self._synced = threading.Event()
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._watch: Optional[watch.Watch] = None
+        self._failures = 0
+
+    @property
+    def synced(self) -> bool:
+        """Whether the cache reflects a successful list and a running watch."""
+        return self._synced.is_set()
+
+    def get(self, name: str) -> Optional[Dict[str, Any]]:
+        """Return the cached resource with the given name, if present."""
+        with self._lock:
+            return self._items.get(name)
+
+    def add_listener(self, listener: Callable[[str, Dict[str, Any]], None]) -> Callable[[], None]:
+        """Register a callback for cache updates; it is called from the watch thread.
+
+        Args:
+            listener: Called with the event type and resource for every update
+
+        Returns:
+            Function that unregisters the listener
+        """
+        with self._lock:
+            self._listeners.append(listener)
+
+        def remove() -> None:
+            with self._lock:
+                self._listeners.remove(listener)
+
+        return remove
+
+    def start(self) -> None:
+        """Start the background list+watch thread if it is not running."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(
+            target=self._run, name=f"velero-informer-{self.plural}", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the watch thread; reads fall back to the API afterwards."""
+        self._stopping.set()
+        self._synced.clear()
+        if self._watch is not None:
+            self._watch.stop()
+
+    def _run(self) -> None:
+        """List, then watch from the listed resource version until stopped."""
+        resource_version: Optional[str] = None
+        while not self._stopping.is_set():
+            try:
+                api = self._get_api()
+                if resource_version is None:
+                    resource_version = self._relist()
+                w = watch.Watch()
+                w._api_client = api.api_client
+                self._watch = w
+                for event in w.stream(
+                    api.list_namespaced_custom_object,
+                    self.group,
+                    self.version,
+                    self.namespace,
+                    self.plural,
+                    label_selector=self.label_selector,
+                    resource_version=resource_version,
+                    timeout_seconds=self.WATCH_TIMEOUT_SECONDS,
+                ):
+                    obj = event["object"]
+                    resource_version = obj["metadata"]["resourceVersion"]
+                    self._apply(event["type"], obj)
+            except ApiException as e:
+                resource_version = None
+                if e.status != 410:
+                    self._fail(e)
+            except Exception as e:
+                resource_version = None
+                self._fail(e)
+
+    def _relist(self) -> str:
+        """Rebuild the cache from a full list and return its resource version.
+
+        The list is requested with resourceVersion=0, so the API server answers
+        from its watch cache instead of reading through to etcd. The watch that
+        follows brings the cache up to date.
+        """
+        listing = _loads(
+            self._get_api().list_namespaced_custom_object(
+                self.group,
+                self.version,
+                self.namespace,
+                self.plural,
+                label_selector=self.label_selector,
+                resource_version="0",
+                _preload_content=False,
+            )
+        )
+        items = {item["metadata"]["name"]: item for item in listing.get("items", [])}
+        with self._lock:
+            self._items = items
+            listeners = list(self._listeners)
+        self._synced.set()
+        self._failures = 0
+        logger.info("Velero informer synced", resource=self.plural, count=len(items))
+
+        for item in items.values():
+            for listener in listeners:
+                listener("ADDED", item)
+        return listing["metadata"]["resourceVersion"]
+
+    def _apply(self, event_type: str, obj: Dict[str, Any]) -> None:
+        """Apply a watch event to the cache and notify listeners."""
+        name = obj["metadata"]["name"]
+        with self._lock:
+            if event_type == "DELETED":
+                self._items.pop(name, None)
+            else:
+                self._items[name] = obj
+            listeners = list(self._listeners)
+        for listener in listeners:
+            listener(event_type, obj)
+
+    def _fail(self, error: Exception) -> None:
+        """Mark the cache unsynced after a watch failure and back off before relisting."""
+        self._synced.clear()
+        delay = _backoff_delay(self._failures, self.RETRY_BASE_SECONDS, self.RETRY_MAX_SECONDS)
+        self._failures += 1
+        logger.warning(
+            "Velero informer watch failed",
+            resource=self.plural,
+            error=str(error),
+            retry_in=round(delay, 2),
+        )
+        self._stopping.wait(delay)
 
 
 class VeleroClient:
     """Client for interacting with Velero resources."""
 
+    # Seconds to wait for a restore deletion before giving up
+    DELETE_TIMEOUT_SECONDS = 30
+
     def __init__(self, namespace: str = "velero"):
         """Initialize Velero client.
 
@@ -48,9 +266,48 @@ class VeleroClient:
             namespace: Namespace where Velero is installed
         """
         self.namespace = namespace
-        self.custom_api = client.CustomObjectsApi()
         self.group = "velero.io"
         self.version = "v1"
+        self.api_version = f"{self.group}/{self.version}"
+        # Bounded pool for the blocking get/create/delete calls. A test issues
+        # them one at a time, and a delete abandoned after its timeout keeps
+        # its worker until the call returns, so allow two per concurrent test
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(2, 2 * get_config().max_concurrent_tests),
+            thread_name_prefix="velero",
+        )
+        self.backups = VeleroInformer(
+            get_custom_objects_api, self.group, self.version, namespace, "backups"
+        )
+        # Only restores created by the operator are ever waited on
+        self.restores = VeleroInformer(
+            get_custom_objects_api,
+            self.group,
+            self.version,
+            namespace,
+            "restores",
+            label_selector=f"{RESTORE_TEST_LABEL}=true",
+        )
+
+    @property
+    def custom_api(self) -> client.CustomObjectsApi:
+        """Shared CustomObjectsApi, created on first use so it sees the loaded kube config."""
+        return get_custom_objects_api()
+
+    def start_informers(self) -> None:
+        """Start caching backups and restores; reads use the API until synced."""
+        self.backups.start()
+        self.restores.start()
+
+    def stop_informers(self) -> None:
+        """Stop the backup and restore informers."""
+        self.backups.stop()
+        self.restores.stop()
+
+    async def aclose(self) -> None:
+        """Stop the informers and shut down the executor used for API calls."""
+        self.stop_informers()
+        self._executor.shutdown(wait=False, cancel_futures=True)
 
     async def get_backup(self, backup_name: str) -> Optional[Dict[str, Any]]:
         """Get a Velero backup by name.
@@ -61,15 +318,25 @@ class VeleroClient:
         Returns:
             Backup resource dict or None if not found
         """
+        if self.backups.synced:
+            backup = self.backups.get(backup_name)
+            if backup is not None:
+                return backup
+
         try:
-            backup = await asyncio.get_event_loop().run_in_executor(
-                None,
-                self.custom_api.get_namespaced_custom_object,
-                self.group,
-                self.version,
-                self.namespace,
-                "backups",
-                backup_name,
+            backup = _loads(
+                await asyncio.get_running_loop().run_in_executor(
+                    self._executor,
+                    partial(
+                        self.custom_api.get_namespaced_custom_object,
+                        self.group,
+                        self.version,
+                        self.namespace,
+                        "backups",
+                        backup_name,
+                        _preload_content=False,
+                    ),
+                )
             )
             logger.info("Retrieved backup", backup_name=backup_name)
             return backup
@@ -107,20 +374,24 @@ class VeleroClient:
             restore_spec["excludedResources"] = restore_config.excluded_resources
 
         # Add namespace mapping to restore into test namespace
-        restore_spec["namespaceMapping"] = {
-            ns: restore_config.target_namespace
-            for ns in restore_config.included_namespaces
-            if ns != "*"
-        }
+        restore_spec["namespaceMapping"] = restore_config.namespace_mapping
+        # A wildcard on its own is the default; next to named namespaces it
+        # restores everything else outside the test namespace
+        if restore_config.namespace_mapping and "*" in restore_config.included_namespaces:
+            logger.warning(
+                "Wildcard included namespace is not remapped to the test namespace",
+                restore_name=restore_name,
+                target_namespace=restore_config.target_namespace,
+            )
 
         restore_body = {
-            "apiVersion": f"{self.group}/{self.version}",
+            "apiVersion": self.api_version,
             "kind": "Restore",
             "metadata": {
                 "name": restore_name,
                 "namespace": self.namespace,
                 "labels": {
-                    "lazarus.io/test": "true",
+                    RESTORE_TEST_LABEL: "true",
                     "lazarus.io/backup": restore_config.backup_name,
                 },
             },
@@ -128,8 +399,8 @@ class VeleroClient:
         }
 
         try:
-            restore = await asyncio.get_event_loop().run_in_executor(
-                None,
+            restore = await asyncio.get_running_loop().run_in_executor(
+                self._executor,
                 self.custom_api.create_namespaced_custom_object,
                 self.group,
                 self.version,
@@ -156,15 +427,25 @@ class VeleroClient:
         Returns:
             Restore resource dict or None if not found
         """
+        if self.restores.synced:
+            restore = self.restores.get(restore_name)
+            if restore is not None:
+                return restore
+
         try:
-            restore = await asyncio.get_event_loop().run_in_executor(
-                None,
-                self.custom_api.get_namespaced_custom_object,
-                self.group,
-                self.version,
-                self.namespace,
-                "restores",
-                restore_name,
+            restore = _loads(
+                await asyncio.get_running_loop().run_in_executor(
+                    self._executor,
+                    partial(
+                        self.custom_api.get_namespaced_custom_object,
+                        self.group,
+                        self.version,
+                        self.namespace,
+                        "restores",
+                        restore_name,
+                        _preload_content=False,
+                    ),
+                )
             )
             return restore
         except ApiException as e:
@@ -172,15 +453,17 @@ class VeleroClient:
                 return None
             raise
 
-    async def wait_for_restore(
-        self, restore_name: str, timeout: int = 600, poll_interval: int = 5
-    ) -> Dict[str, Any]:
+    async def wait_for_restore(self, restore_name: str, timeout: int = 600) -> Dict[str, Any]:
         """Wait for a Velero restore to complete.
 
+        Phase changes are taken from the restore informer as soon as the API
+        server reports them. While the informer is not synced the restore is
+        re-read with backoff instead. The wait runs entirely on the event loop,
+        so cancelling it leaves no blocked worker thread behind.
+
         Args:
             restore_name: Name of the restore
             timeout: Maximum time to wait in seconds
-            poll_interval: Polling interval in seconds
 
         Returns:
             Final restore resource
@@ -189,62 +472,126 @@ class VeleroClient:
             TimeoutError: If restore doesn't complete within timeout
             RuntimeError: If restore fails
         """
-        start_time = datetime.utcnow()
-        elapsed = 0
-
         logger.info("Waiting for restore to complete", restore_name=restore_name, timeout=timeout)
 
-        while elapsed < timeout:
-            restore = await self.get_restore(restore_name)
+        restore = await self._wait_with_informer(restore_name, timeout)
+        if restore is None:
+            raise TimeoutError(f"Restore {restore_name} did not complete within {timeout} seconds")
 
-            if not restore:
-                raise RuntimeError(f"Restore {restore_name} not found")
+        phase = restore["status"]["phase"]
+        if phase == "Completed":
+            logger.info("Restore completed successfully", restore_name=restore_name)
+            return restore
 
-            phase = restore.get("status", {}).get("phase", "New")
-            logger.debug("Restore status", restore_name=restore_name, phase=phase)
+        errors = restore.get("status", {}).get("errors", [])
+        warnings = restore.get("status", {}).get("warnings", [])
+        logger.error(
+            "Restore failed",
+            restore_name=restore_name,
+            phase=phase,
+            errors=errors,
+            warnings=warnings,
+        )
+        raise RuntimeError(
+            f"Restore {restore_name} {phase.lower()}: "
+            f"errors={len(errors)}, warnings={len(warnings)}"
+        )
 
-            if phase == "Completed":
-                logger.info("Restore completed successfully", restore_name=restore_name)
-                return restore
-            elif phase in ["Failed", "PartiallyFailed"]:
-                errors = restore.get("status", {}).get("errors", [])
-                warnings = restore.get("status", {}).get("warnings", [])
-                logger.error(
-                    "Restore failed",
-                    restore_name=restore_name,
-                    phase=phase,
-                    errors=errors,
-                    warnings=warnings,
-                )
-                raise RuntimeError(
-                    f"Restore {restore_name} {phase.lower()}: "
-                    f"errors={len(errors)}, warnings={len(warnings)}"
-                )
+    async def _wait_with_informer(
+        self, restore_name: str, timeout: float
+    ) -> Optional[Dict[str, Any]]:
+        """Wait for the restore informer to report a terminal phase.
+
+        Args:
+            restore_name: Name of the restore
+            timeout: Maximum time to wait in seconds
 
-            await asyncio.sleep(poll_interval)
-            elapsed = (datetime.utcnow() - start_time).total_seconds()
+        Returns:
+            Restore resource in a terminal phase, or None on timeout
 
-        raise TimeoutError(
-            f"Restore {restore_name} did not complete within {timeout} seconds"
-        )
+        Raises:
+            RuntimeError: If the restore does not exist or is deleted while waiting
+        """
+        loop = asyncio.get_running_loop()
+        done: "asyncio.Future[Optional[Dict[str, Any]]]" = loop.create_future()
+        last_phase: Optional[str] = None
+
+        def resolve(restore: Optional[Dict[str, Any]]) -> None:
+            if not done.done():
+                done.set_result(restore)
+
+        def on_event(event_type: str, restore: Dict[str, Any]) -> None:
+            nonlocal last_phase
+            if restore["metadata"]["name"] != restore_name:
+                return
+            if event_type == "DELETED":
+                loop.call_soon_threadsafe(resolve, None)
+                return
+
+            phase = restore.get("status", {}).get("phase", "New")
+            # Progress updates arrive as events too; log phase transitions only
+            if phase != last_phase:
+                logger.info("Restore phase changed", restore_name=restore_name, phase=phase)
+                last_phase = phase
+            if phase in TERMINAL_RESTORE_PHASES:
+                loop.call_soon_threadsafe(resolve, restore)
+
+        # Listen before reading so a transition between the two is not missed
+        remove_listener = self.restores.add_listener(on_event)
+        try:
+            async with asyncio.timeout(timeout):
+                attempt = 0
+                while True:
+                    restore = await self.get_restore(restore_name)
+                    if not restore:
+                        raise RuntimeError(f"Restore {restore_name} not found")
+                    if restore.get("status", {}).get("phase") in TERMINAL_RESTORE_PHASES:
+                        return restore
+
+                    # An unsynced informer may deliver nothing, so re-read after a backoff
+                    delay = None if self.restores.synced else _backoff_delay(attempt)
+                    attempt += 1
+                    try:
+                        restore = await asyncio.wait_for(asyncio.shield(done), delay)
+                    except TimeoutError:
+                        continue
+                    if restore is None:
+                        raise RuntimeError(f"Restore {restore_name} not found")
+                    return restore
+        except TimeoutError:
+            return None
+        finally:
+            remove_listener()
 
     async def delete_restore(self, restore_name: str) -> None:
         """Delete a Velero restore.
 
+        Gives up after DELETE_TIMEOUT_SECONDS so a slow API server cannot stall
+        the cleanup that awaits it.
+
         Args:
             restore_name: Name of the restore to delete
         """
         try:
-            await asyncio.get_event_loop().run_in_executor(
-                None,
-                self.custom_api.delete_namespaced_custom_object,
-                self.group,
-                self.version,
-                self.namespace,
-                "restores",
-                restore_name,
+            await asyncio.wait_for(
+                asyncio.get_running_loop().run_in_executor(
+                    self._executor,
+                    self.custom_api.delete_namespaced_custom_object,
+                    self.group,
+                    self.version,
+                    self.namespace,
+                    "restores",
+                    restore_name,
+                ),
+                timeout=self.DELETE_TIMEOUT_SECONDS,
             )
             logger.info("Deleted restore", restore_name=restore_name)
+        except TimeoutError:
+            logger.warning(
+                "Timed out deleting restore",
+                restore_name=restore_name,
+                timeout=self.DELETE_TIMEOUT_SECONDS,
+            )
         except ApiException as e:
             if e.status != 404:
                 logger.warning("Failed to delete restore", restore_name=restore_name, error=str(e))
@@ -258,16 +605,16 @@ class VeleroClient:
         Returns:
             Dict with restored/failed resource counts
         """
-        status = restore.get("status", {})
-        progress = status.get("progress", {})
+        status = restore.get("status") or {}
+        progress = status.get("progress") or {}
 
         return {
             "items_attempted": progress.get("totalItems", 0),
             "items_restored": progress.get("itemsRestored", 0),
-            "errors": len(status.get("errors", [])),
-            "warnings": len(status.get("warnings", [])),
+            "errors": len(status.get("errors") or ()),
+            "warnings": len(status.get("warnings") or ()),
         }
 
 
 # Global Velero client instance
-velero_client = VeleroClient(namespace=config.velero_namespace)
+velero_client = VeleroClient(namespace=get_config().velero_namespace)
@@ -0,0 +1,100 @@
+"""Tests for operator configuration."""
+
+import importlib.util
+import sys
+import types
+from pathlib import Path
+
+import msgspec
+import pytest
+
+from lazarus_operator.config import OperatorConfig, get_config, reset_config
+
+
+@pytest.fixture(autouse=True)
+def fresh_config():
+    """Ensure each test loads configuration from a clean cache."""
+    reset_config()
+    yield
+    reset_config()
+
+
+class TestConfig:
+    """Test cases for configuration loading."""
+
+    def test_get_config_is_cached(self):
+        """Test that repeated calls return the same instance."""
+        assert get_config() is get_config()
+
+    def test_reset_config_reloads_environment(self, monkeypatch):
+        """Test that reset_config picks up environment changes."""
+        monkeypatch.setenv("LAZARUS_VELERO_TIMEOUT", "120")
+        first = get_config()
+        assert first.velero_timeout == 120
+
+        monkeypatch.setenv("LAZARUS_VELERO_TIMEOUT", "300")
+        assert get_config().velero_timeout == 120
+
+        reset_config()
+        assert get_config().velero_timeout == 300
+
+    def test_frozen_config(self, monkeypatch):
+        """Test that LAZARUS_FROZEN_CONFIG loads the baked-in values."""
+        frozen = types.ModuleType("lazarus_operator.config_frozen")
+        frozen.config = OperatorConfig(namespace="frozen-ns")
+        monkeypatch.setitem(sys.modules, "lazarus_operator.config_frozen", frozen)
+        monkeypatch.setenv("LAZARUS_FROZEN_CONFIG", "1")
+
+        config = get_config()
+        assert isinstance(config, OperatorConfig)
+        assert config.namespace == "frozen-ns"
+
+    def test_freeze_config_renders_operator_config(self):
+        """Test that the generated module builds an equal OperatorConfig."""
+        script = Path(__file__).resolve().parent.parent / "scripts" / "freeze_config.py"
+        spec = importlib.util.spec_from_file_location("freeze_config", script)
+        freeze_config = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(freeze_config)
+        expected = OperatorConfig(namespace="frozen-ns", slack_webhook_url=None)
+
+        module = types.ModuleType("lazarus_operator.config_frozen")
+        module.__package__ = "lazarus_operator"
+        exec(freeze_config.render(expected), module.__dict__)
+
+        assert module.config == expected
+
+    def test_from_env_reads_env_file(self, tmp_path, monkeypatch):
+        """Test .env parsing with comments, quotes and export prefixes."""
+        env_file = tmp_path / ".env"
+        env_file.write_text(
+            "# comment\n"
+            "LAZARUS_LOG_LEVEL=DEBUG\n"
+            "export LAZARUS_METRICS_PORT=9090\n"
+            "LAZARUS_SLACK_CHANNEL='#alerts'\n"
+            "LAZARUS_ENABLE_METRICS=false\n"
+        )
+        monkeypatch.delenv("LAZARUS_LOG_LEVEL", raising=False)
+        monkeypatch.setenv("LAZARUS_METRICS_PORT", "9191")
+
+        config = OperatorConfig.from_env(str(env_file))
+
+        assert config.log_level == "DEBUG"
+        assert config.metrics_port == 9191  # Environment wins over .env
+        assert config.slack_channel == "#alerts"
+        assert config.enable_metrics is False
+
+    @pytest.mark.parametrize(
+        "value, expected", [("yes", True), ("On", True), ("no", False), ("off", False)]
+    )
+    def test_from_env_accepts_pydantic_bool_strings(self, monkeypatch, value, expected):
+        """Test that boolean spellings accepted by pydantic-settings still parse."""
+        monkeypatch.setenv("LAZARUS_ENABLE_METRICS", value)
+
+        assert OperatorConfig.from_env(env_file=None).enable_metrics is expected
+
+    def test_from_env_rejects_invalid_values(self, monkeypatch):
+        """Test that values of the wrong type raise a validation error."""
+        monkeypatch.setenv("LAZARUS_VELERO_TIMEOUT", "soon")
+
+        with pytest.raises(msgspec.ValidationError):
+            OperatorConfig.from_env(env_file=None)
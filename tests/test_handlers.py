@@ -0,0 +1,49 @@
+"""Tests for the restore test handlers."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import kopf
+import pytest
+from kubernetes.client.rest import ApiException
+
+from lazarus_operator import handlers
+
+SPEC = {"backupName": "b1", "restoreNamespace": "lazarus-test-b1"}
+
+
+@pytest.fixture
+def failing_backup_lookup():
+    """Patch handler dependencies so the backup lookup fails with an API error."""
+    velero_client = MagicMock()
+    velero_client.get_backup = AsyncMock(side_effect=ApiException(status=500))
+
+    with patch.object(handlers, "velero_client", velero_client), patch.object(
+        handlers, "create_k8s_event", MagicMock()
+    ), patch.object(handlers, "delete_namespace", AsyncMock()) as delete_namespace:
+        yield delete_namespace
+
+
+class TestRestoreTestCreate:
+    """Test cases for handle_restore_test_create."""
+
+    @pytest.mark.asyncio
+    async def test_namespace_discarded_when_backup_lookup_fails(self, failing_backup_lookup):
+        """Test that a namespace created alongside a failed backup lookup is deleted."""
+        with patch.object(handlers, "create_test_namespace", AsyncMock(return_value=True)):
+            with pytest.raises(kopf.TemporaryError):
+                await handlers.handle_restore_test_create(
+                    body={}, spec=SPEC, name="t", namespace="ns"
+                )
+
+        failing_backup_lookup.assert_awaited_once_with("lazarus-test-b1")
+
+    @pytest.mark.asyncio
+    async def test_existing_namespace_kept_when_backup_lookup_fails(self, failing_backup_lookup):
+        """Test that a namespace which already existed is not deleted on failure."""
+        with patch.object(handlers, "create_test_namespace", AsyncMock(return_value=False)):
+            with pytest.raises(kopf.TemporaryError):
+                await handlers.handle_restore_test_create(
+                    body={}, spec=SPEC, name="t", namespace="ns"
+                )
+
+        failing_backup_lookup.assert_not_awaited()
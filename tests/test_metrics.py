@@ -0,0 +1,73 @@
+"""Tests for Prometheus metrics collection."""
+
+import pytest
+from prometheus_client import CollectorRegistry
+
+from lazarus_operator.metrics import MetricsCollector
+
+
+@pytest.fixture
+def collector():
+    """Create a metrics collector with its own registry."""
+    return MetricsCollector(registry=CollectorRegistry())
+
+
+class TestMetricsCollector:
+    """Test cases for MetricsCollector."""
+
+    def test_collectors_use_separate_registries(self):
+        """Test that multiple collectors can be created without clashing."""
+        first = MetricsCollector()
+        second = MetricsCollector()
+
+        assert first.registry is not second.registry
+
+    def test_record_test_complete(self, collector):
+        """Test recording a completed test."""
+        collector.record_test_start("backup-1")
+        collector.record_test_complete("backup-1", success=True, duration=42, rto=40, rpo=0)
+        collector.record_test_complete("backup-1", success=True, duration=10, rto=8, rpo=0)
+
+        registry = collector.registry
+        assert (
+            registry.get_sample_value(
+                "lazarus_restore_tests_total", {"backup_name": "backup-1", "result": "success"}
+            )
+            == 2
+        )
+        assert registry.get_sample_value("lazarus_recovery_time_objective_seconds_sum") == 48
+        assert (
+            registry.get_sample_value(
+                "lazarus_restore_test_duration_seconds_count", {"phase": "total"}
+            )
+            == 2
+        )
+
+    def test_record_cleanup(self, collector):
+        """Test recording cleanup results."""
+        collector.record_cleanup(success=True)
+        collector.record_cleanup(success=False)
+        collector.record_cleanup(success=False)
+
+        registry = collector.registry
+        assert (
+            registry.get_sample_value("lazarus_cleanup_operations_total", {"result": "success"})
+            == 1
+        )
+        assert (
+            registry.get_sample_value("lazarus_cleanup_operations_total", {"result": "failure"})
+            == 2
+        )
+
+    def test_record_health_check(self, collector):
+        """Test recording health check results."""
+        collector.record_health_check("custom", "db", success=True, duration=0.5)
+        collector.record_health_check("custom", "db", success=False, duration=1.5)
+
+        registry = collector.registry
+        labels = {"check_type": "custom", "check_name": "db"}
+        assert (
+            registry.get_sample_value("lazarus_health_checks_total", {**labels, "result": "pass"})
+            == 1
+        )
+        assert registry.get_sample_value("lazarus_health_check_duration_seconds_sum", labels) == 2
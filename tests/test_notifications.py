@@ -0,0 +1,127 @@
+"""Tests for the notification service."""
+
+import orjson
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from lazarus_operator.notifications import NotificationService
+
+
+def make_response(status_code, headers=None):
+    """Build a fake Slack webhook response."""
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.text = "ok" if status_code == 200 else "error"
+    return response
+
+
+class TestNotificationService:
+    """Test cases for Slack notifications."""
+
+    @pytest.fixture
+    def service(self):
+        """Notification service with a mocked Slack client."""
+        service = NotificationService()
+        service.slack_client = AsyncMock()
+        service.slack_webhook_url = "https://hooks.slack.com/services/T000/B000/XXX"
+        service.max_retries = 3
+        return service
+
+    @pytest.mark.asyncio
+    async def test_retry_after_is_honored(self, service):
+        """Test that a 429 response waits for Retry-After before resending."""
+        service.slack_client.post = AsyncMock(
+            side_effect=[make_response(429, {"Retry-After": "2"}), make_response(200)]
+        )
+
+        with patch("lazarus_operator.notifications.asyncio.sleep") as mock_sleep:
+            response = await service._send_with_retry(text="hi", blocks=[])
+
+        assert response.status_code == 200
+        assert service.slack_client.post.await_count == 2
+        mock_sleep.assert_awaited_once_with(2.0)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "retry_after, expected",
+        [
+            ("Wed, 21 Oct 2015 07:28:00 GMT", 0.0),
+            ("soon", 0.2),
+            ("3600", 30.0),
+        ],
+    )
+    async def test_retry_after_date_invalid_and_large(self, service, retry_after, expected):
+        """Test HTTP-date, unparseable and oversized Retry-After values."""
+        service.slack_client.post = AsyncMock(
+            side_effect=[make_response(429, {"Retry-After": retry_after}), make_response(200)]
+        )
+
+        with patch("lazarus_operator.notifications.asyncio.sleep") as mock_sleep:
+            response = await service._send_with_retry(text="hi", blocks=[])
+
+        assert response.status_code == 200
+        mock_sleep.assert_awaited_once_with(pytest.approx(expected))
+
+    @pytest.mark.asyncio
+    async def test_server_errors_back_off_until_retries_exhausted(self, service):
+        """Test exponential backoff on 5xx responses, bounded by max_retries."""
+        service.slack_client.post = AsyncMock(return_value=make_response(503))
+
+        with patch("lazarus_operator.notifications.asyncio.sleep") as mock_sleep:
+            response = await service._send_with_retry(text="hi", blocks=[])
+
+        assert response.status_code == 503
+        assert service.slack_client.post.await_count == 4
+        delays = [call.args[0] for call in mock_sleep.await_args_list]
+        assert delays == pytest.approx([0.2, 0.4, 0.8])
+
+    @pytest.mark.asyncio
+    async def test_client_errors_are_not_retried(self, service):
+        """Test that other 4xx responses are returned immediately."""
+        service.slack_client.post = AsyncMock(return_value=make_response(404))
+
+        response = await service._send_with_retry(text="hi", blocks=[])
+
+        assert response.status_code == 404
+        assert service.slack_client.post.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_send_without_webhook_raises(self, service):
+        """Test that sending without a configured webhook raises instead of posting."""
+        service.slack_webhook_url = None
+
+        with pytest.raises(RuntimeError, match="not configured"):
+            await service._send_with_retry(text="hi", blocks=[])
+
+        service.slack_client.post.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_notifications_are_coalesced(self, service):
+        """Test that notifications within one window are sent as a single post."""
+        service.coalesce_window = 0.01
+        service.slack_client.post = AsyncMock(return_value=make_response(200))
+
+        await service.notify_test_success("test-a", "backup-a", {"rto": 10})
+        await service.notify_test_failure("test-b", "backup-b", "restore failed", {})
+        await service.aclose()
+
+        service.slack_client.post.assert_awaited_once()
+        payload = orjson.loads(service.slack_client.post.await_args.kwargs["content"])
+        assert payload["text"] == "2 backup restore test results"
+        assert {"type": "divider"} in payload["blocks"]
+
+    @pytest.mark.asyncio
+    async def test_coalesced_posts_respect_block_limit(self, service):
+        """Test that large batches are split to stay within Slack's block limit."""
+        service.slack_client.post = AsyncMock(return_value=make_response(200))
+        items = [(f"msg-{i}", [{"type": "section"}] * 20) for i in range(3)]
+
+        await service._flush(items)
+
+        assert service.slack_client.post.await_count == 2
+        sizes = [
+            len(orjson.loads(call.kwargs["content"])["blocks"])
+            for call in service.slack_client.post.await_args_list
+        ]
+        assert sizes == [41, 20]
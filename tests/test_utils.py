@@ -1,9 +1,17 @@
 """Tests for utility functions."""
 
+import base64
+import threading
+import time
+
 import pytest
 from datetime import timedelta
+from kubernetes.client.rest import ApiException
+from unittest.mock import MagicMock, patch
 
+from lazarus_operator import utils
 from lazarus_operator.utils import (
+    _SecretCache,
     generate_test_namespace_name,
     parse_duration,
     sanitize_resource_name,
@@ -81,3 +89,120 @@ class TestUtils:
         elapsed = calculate_elapsed_seconds(start)
 
         assert elapsed > 0  # Should be positive
+
+    def test_calculate_elapsed_seconds_naive_is_utc(self):
+        """Test that timestamps without an offset are treated as UTC."""
+        elapsed = calculate_elapsed_seconds("2025-12-31T00:00:00", "2025-12-31T00:10:00Z")
+        assert elapsed == 600
+
+    def test_api_wrappers_share_one_pooled_client(self):
+        """Test that API wrappers share an ApiClient sized for tests and watches."""
+        factories = (utils.get_api_client, utils.get_core_v1_api, utils.get_custom_objects_api)
+        for factory in factories:
+            factory.cache_clear()
+        try:
+            api_client = utils.get_api_client()
+            assert utils.get_core_v1_api().api_client is api_client
+            assert utils.get_custom_objects_api().api_client is api_client
+            assert api_client.configuration.connection_pool_maxsize >= (
+                2 * utils.get_config().max_concurrent_tests + 2
+            )
+        finally:
+            for factory in factories:
+                factory.cache_clear()
+
+
+class TestSecretCache:
+    """Test cases for the watch-backed secret cache."""
+
+    def test_secret_reads_are_cached(self):
+        """Test that repeated lookups read the secret from the API once."""
+        cache = _SecretCache()
+        released = threading.Event()
+
+        def fake_stream(*args, **kwargs):
+            released.wait(timeout=5)
+            return iter(())
+
+        secret = MagicMock()
+        secret.metadata.name = "db-creds"
+        secret.data = {"url": base64.b64encode(b"postgresql://db/app").decode()}
+        v1 = MagicMock()
+        v1.read_namespaced_secret.return_value = secret
+
+        with patch("lazarus_operator.utils.get_core_v1_api", return_value=v1), patch(
+            "lazarus_operator.utils.watch.Watch"
+        ) as mock_watch:
+            mock_watch.return_value.stream.side_effect = fake_stream
+            try:
+                assert cache.get("test-ns", "db-creds", "url") == "postgresql://db/app"
+                assert cache.get("test-ns", "db-creds", "url") == "postgresql://db/app"
+                assert cache.get("test-ns", "db-creds", "missing") is None
+            finally:
+                cache.stop("test-ns")
+                released.set()
+
+        v1.read_namespaced_secret.assert_called_once_with(name="db-creds", namespace="test-ns")
+        mock_watch.return_value.stop.assert_called_once()
+
+    @staticmethod
+    def _secret(name, resource_version):
+        """Build a fake V1Secret."""
+        secret = MagicMock()
+        secret.metadata.name = name
+        secret.metadata.resource_version = resource_version
+        secret.data = {"key": base64.b64encode(name.encode()).decode()}
+        return secret
+
+    def test_watch_resumes_from_last_version_and_relists_on_410(self):
+        """Test that the watch resumes where it left off and only relists when history expires."""
+        cache = _SecretCache()
+        w = MagicMock()
+        cache._watches["test-ns"] = w
+        cache._last_used["test-ns"] = time.monotonic()
+        cache._requested.add(("test-ns", "db-creds"))
+        cached_before_410 = []
+
+        def fake_stream(*args, **kwargs):
+            call = w.stream.call_count
+            if call == 1:
+                return iter(
+                    [
+                        {"type": "MODIFIED", "object": self._secret("db-creds", "5")},
+                        {"type": "ADDED", "object": self._secret("unrelated", "6")},
+                    ]
+                )
+            if call == 2:
+                cached_before_410.append(("test-ns", "db-creds") in cache._secrets)
+                raise ApiException(status=410)
+            cache._watches.pop("test-ns")
+            return iter(())
+
+        w.stream.side_effect = fake_stream
+        v1 = MagicMock()
+        v1.list_namespaced_secret.return_value.metadata.resource_version = "9"
+
+        with patch("lazarus_operator.utils.get_core_v1_api", return_value=v1):
+            cache._run_watch("test-ns", w, "1")
+
+        versions = [c.kwargs["resource_version"] for c in w.stream.call_args_list]
+        assert versions == ["1", "6", "9"]
+        assert cached_before_410 == [True]
+        assert ("test-ns", "unrelated") not in cache._secrets
+        assert ("test-ns", "db-creds") not in cache._secrets  # Dropped after the 410
+        v1.list_namespaced_secret.assert_called_once_with("test-ns", limit=1)
+
+    def test_idle_watch_stops(self):
+        """Test that a watch with no recent lookups stops and forgets its namespace."""
+        cache = _SecretCache()
+        w = MagicMock()
+        cache._watches["test-ns"] = w
+        cache._last_used["test-ns"] = time.monotonic() - cache.IDLE_TIMEOUT_SECONDS - 1
+        cache._requested.add(("test-ns", "db-creds"))
+
+        with patch("lazarus_operator.utils.get_core_v1_api"):
+            cache._run_watch("test-ns", w, "1")
+
+        w.stream.assert_not_called()
+        assert "test-ns" not in cache._watches
+        assert not cache._requested
@@ -1,9 +1,18 @@
 """Tests for the Velero client."""
 
+import asyncio
+import threading
+
+import orjson
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
-from lazarus_operator.velero_client import VeleroClient, VeleroRestoreConfig
+from lazarus_operator.velero_client import VeleroClient, VeleroRestoreConfig, _backoff_delay
+
+
+def _raw_response(obj):
+    """Build a fake undecoded API response, as returned with _preload_content=False."""
+    return MagicMock(data=orjson.dumps(obj))
 
 
 @pytest.fixture
@@ -37,7 +46,7 @@ class TestVeleroClient:
         with patch.object(
             velero_client.custom_api,
             "get_namespaced_custom_object",
-            return_value=mock_backup,
+            return_value=_raw_response(mock_backup),
         ):
             backup = await velero_client.get_backup("test-backup")
 
@@ -90,9 +99,7 @@ class TestVeleroClient:
         with patch.object(
             velero_client, "get_restore", return_value=completed_restore
         ):
-            restore = await velero_client.wait_for_restore(
-                "test-restore", timeout=10, poll_interval=1
-            )
+            restore = await velero_client.wait_for_restore("test-restore", timeout=10)
 
             assert restore["status"]["phase"] == "Completed"
 
@@ -104,13 +111,69 @@ class TestVeleroClient:
             "status": {"phase": "InProgress"},
         }
 
-        with patch.object(
-            velero_client, "get_restore", return_value=in_progress_restore
-        ):
+        with patch.object(velero_client, "get_restore", return_value=in_progress_restore):
             with pytest.raises(TimeoutError):
-                await velero_client.wait_for_restore(
-                    "test-restore", timeout=2, poll_interval=1
-                )
+                await velero_client.wait_for_restore("test-restore", timeout=1)
+
+    @pytest.mark.asyncio
+    async def test_wait_for_restore_rereads_while_informer_unsynced(self, velero_client):
+        """Test that the restore is re-read with backoff when the informer is not synced."""
+        in_progress = {"metadata": {"name": "test-restore"}, "status": {"phase": "InProgress"}}
+        completed = {"metadata": {"name": "test-restore"}, "status": {"phase": "Completed"}}
+
+        with patch.object(
+            velero_client, "get_restore", side_effect=[in_progress, in_progress, completed]
+        ) as mock_get, patch(
+            "lazarus_operator.velero_client._backoff_delay", return_value=0.01
+        ) as mock_backoff:
+            restore = await velero_client.wait_for_restore("test-restore", timeout=5)
+
+        assert restore is completed
+        assert mock_get.call_count == 3
+        assert [c.args[0] for c in mock_backoff.call_args_list] == [0, 1]
+
+    @pytest.mark.asyncio
+    async def test_wait_for_restore_cancel_leaves_no_thread(self, velero_client):
+        """Test that cancelling a wait returns promptly and unregisters its listener."""
+        in_progress = {"metadata": {"name": "test-restore"}, "status": {"phase": "InProgress"}}
+        velero_client.restores._apply("ADDED", in_progress)
+        velero_client.restores._synced.set()
+
+        waiter = asyncio.create_task(velero_client.wait_for_restore("test-restore", timeout=600))
+        await asyncio.sleep(0.05)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.wait_for(waiter, timeout=1)
+
+        assert velero_client.restores._listeners == []
+        assert not velero_client._executor._threads
+
+    @pytest.mark.asyncio
+    async def test_wait_for_restore_logs_phase_changes_only(self, velero_client):
+        """Test that repeated events in the same phase are not logged again."""
+        velero_client.restores._apply(
+            "ADDED", {"metadata": {"name": "test-restore"}, "status": {"phase": "New"}}
+        )
+        velero_client.restores._synced.set()
+
+        def publish():
+            for phase in ["InProgress", "InProgress", "InProgress", "Completed"]:
+                restore = {"metadata": {"name": "test-restore"}, "status": {"phase": phase}}
+                velero_client.restores._apply("MODIFIED", restore)
+
+        with patch("lazarus_operator.velero_client.logger") as mock_logger:
+            waiter = asyncio.create_task(velero_client.wait_for_restore("test-restore", timeout=5))
+            await asyncio.sleep(0.05)
+            await asyncio.to_thread(publish)
+            restore = await waiter
+
+        assert restore["status"]["phase"] == "Completed"
+        logged = [
+            c.kwargs["phase"]
+            for c in mock_logger.info.call_args_list
+            if c.args == ("Restore phase changed",)
+        ]
+        assert logged == ["InProgress", "Completed"]
 
     @pytest.mark.asyncio
     async def test_wait_for_restore_failed(self, velero_client):
@@ -129,6 +192,167 @@ class TestVeleroClient:
             with pytest.raises(RuntimeError, match="failed"):
                 await velero_client.wait_for_restore("test-restore", timeout=10)
 
+    @pytest.mark.asyncio
+    async def test_get_backup_served_from_informer(self, velero_client):
+        """Test that a synced informer answers reads without an API call."""
+        backup = {"metadata": {"name": "test-backup"}, "status": {"phase": "Completed"}}
+        velero_client.backups._apply("ADDED", backup)
+        velero_client.backups._synced.set()
+
+        with patch.object(velero_client.custom_api, "get_namespaced_custom_object") as mock_get:
+            assert await velero_client.get_backup("test-backup") is backup
+            mock_get.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_wait_for_restore_with_informer(self, velero_client):
+        """Test that waiting resolves when the informer sees a terminal phase."""
+        in_progress = {"metadata": {"name": "test-restore"}, "status": {"phase": "InProgress"}}
+        completed = {"metadata": {"name": "test-restore"}, "status": {"phase": "Completed"}}
+        velero_client.restores._apply("ADDED", in_progress)
+        velero_client.restores._synced.set()
+
+        async def complete_later():
+            await asyncio.sleep(0.05)
+            await asyncio.to_thread(velero_client.restores._apply, "MODIFIED", completed)
+
+        updater = asyncio.create_task(complete_later())
+        restore = await velero_client.wait_for_restore("test-restore", timeout=5)
+        await updater
+
+        assert restore is completed
+        assert velero_client.restores._listeners == []
+
+    def test_informer_relist_replaces_cache(self, velero_client):
+        """Test that relisting rebuilds the cache from the listed items."""
+        informer = velero_client.restores
+        informer._apply("ADDED", {"metadata": {"name": "stale"}})
+
+        with patch.object(
+            velero_client.custom_api,
+            "list_namespaced_custom_object",
+            return_value=_raw_response(
+                {
+                    "metadata": {"resourceVersion": "42"},
+                    "items": [{"metadata": {"name": "fresh"}}],
+                }
+            ),
+        ):
+            assert informer._relist() == "42"
+
+        assert informer.synced
+        assert informer.get("stale") is None
+        assert informer.get("fresh") is not None
+
+    def test_restore_informer_only_lists_test_restores(self, velero_client):
+        """Test that the restore informer selects operator restores and backups are unfiltered."""
+        listing = {"metadata": {"resourceVersion": "1"}, "items": []}
+
+        with patch.object(
+            velero_client.custom_api,
+            "list_namespaced_custom_object",
+            side_effect=lambda *args, **kwargs: _raw_response(listing),
+        ) as mock_list:
+            velero_client.restores._relist()
+            velero_client.backups._relist()
+
+        restores_call, backups_call = mock_list.call_args_list
+        assert restores_call.kwargs["label_selector"] == "lazarus.io/test=true"
+        assert backups_call.kwargs["label_selector"] is None
+        assert restores_call.kwargs["resource_version"] == "0"
+
+    def test_informer_failures_back_off(self, velero_client):
+        """Test that repeated watch failures wait longer, capped, and reset on relist."""
+        informer = velero_client.restores
+        waits = []
+        informer._stopping.wait = waits.append
+
+        with patch("lazarus_operator.velero_client.random.uniform", return_value=1.0):
+            for _ in range(7):
+                informer._fail(RuntimeError("boom"))
+            assert waits == [1.0, 2.0, 4.0, 8.0, 16.0, 30.0, 30.0]
+
+            with patch.object(
+                velero_client.custom_api,
+                "list_namespaced_custom_object",
+                return_value=_raw_response({"metadata": {"resourceVersion": "1"}, "items": []}),
+            ):
+                informer._relist()
+            informer._fail(RuntimeError("boom"))
+
+        assert waits[-1] == 1.0
+        assert 0.5 <= _backoff_delay(0) <= 1.5
+
+    @pytest.mark.asyncio
+    async def test_delete_restore_times_out(self, velero_client):
+        """Test that a hung delete call is abandoned after the timeout."""
+        release = threading.Event()
+        velero_client.DELETE_TIMEOUT_SECONDS = 0.05
+
+        with patch.object(
+            velero_client.custom_api,
+            "delete_namespaced_custom_object",
+            side_effect=lambda *args: release.wait(5),
+        ):
+            try:
+                await asyncio.wait_for(velero_client.delete_restore("stuck"), timeout=2)
+            finally:
+                release.set()
+
+    @pytest.mark.asyncio
+    async def test_aclose_stops_informers_and_executor(self, velero_client):
+        """Test that aclose stops the informers and the API call executor."""
+        with patch.object(velero_client, "stop_informers") as stop_informers:
+            await velero_client.aclose()
+
+        stop_informers.assert_called_once()
+        with pytest.raises(RuntimeError):
+            velero_client._executor.submit(print)
+
+    def test_restore_config_defaults(self):
+        """Test that unset filters get their defaults and instances have no __dict__."""
+        config = VeleroRestoreConfig(backup_name="b", target_namespace="t")
+
+        assert config.included_namespaces == ["*"]
+        assert config.excluded_namespaces == []
+        assert config.included_resources == []
+        assert config.namespace_mapping == {}
+        assert not hasattr(config, "__dict__")
+
+    def test_namespace_mapping_skips_wildcard(self):
+        """Test that named namespaces map to the target and the wildcard is skipped."""
+        config = VeleroRestoreConfig(
+            backup_name="b", target_namespace="t", included_namespaces=["*", "app"]
+        )
+
+        assert config.namespace_mapping == {"app": "t"}
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("included, warned", [(["*"], False), (["*", "app"], True)])
+    async def test_create_restore_warns_on_mixed_wildcard(self, velero_client, included, warned):
+        """Test that only a wildcard next to named namespaces logs a warning."""
+        config = VeleroRestoreConfig(
+            backup_name="b", target_namespace="t", included_namespaces=included
+        )
+
+        with patch.object(
+            velero_client.custom_api, "create_namespaced_custom_object", return_value={}
+        ), patch("lazarus_operator.velero_client.logger") as mock_logger:
+            await velero_client.create_restore("r", config)
+
+        assert mock_logger.warning.called is warned
+
+    def test_parse_restore_stats_with_null_fields(self, velero_client):
+        """Test that null status fields count as empty."""
+        restore = {"status": {"progress": None, "errors": None, "warnings": None}}
+
+        assert velero_client.parse_restore_stats(restore) == {
+            "items_attempted": 0,
+            "items_restored": 0,
+            "errors": 0,
+            "warnings": 0,
+        }
+        assert velero_client.parse_restore_stats({"status": None})["errors"] == 0
+
     def test_parse_restore_stats(self, velero_client):
         """Test parsing restore statistics."""
         restore = {